@@ -9,6 +9,9 @@ Requires:
 Optional:
   pip install pycaw comtypes
   pip install pywin32
+  pip install mss
+  pip install pyfftw scipy
+  pip install numba
 """
 
 import os
@@ -16,11 +19,14 @@ import sys
 import time
 import re
 import threading
+import functools
+import itertools
 import asyncio
 import multiprocessing as mp
+from multiprocessing import shared_memory
 import atexit
-from datetime import datetime
-from queue import Queue, Empty
+from collections import deque
+from queue import Queue, Empty, Full
 
 # Force STA for comtypes everywhere
 sys.coinit_flags = 2  # COINIT_APARTMENTTHREADED
@@ -30,17 +36,11 @@ import requests
 import serial
 import serial.tools.list_ports
 import psutil
+import numpy as np
 from unidecode import unidecode
 from PIL import ImageGrab, Image
 from screeninfo import get_monitors
 
-# Optional: numpy for VU worker
-try:
-    import numpy as np
-    HAVE_NUMPY = True
-except Exception:
-    HAVE_NUMPY = False
-
 # Optional: Windows APIs (foreground exe)
 try:
     import win32gui
@@ -61,10 +61,36 @@ except Exception:
     except Exception:
         MUSIC_OK = False
 
+# Optional: fast screen capture (falls back to PIL ImageGrab)
+try:
+    import mss
+    MSS_OK = True
+except Exception:
+    MSS_OK = False
+
+# Optional: JIT-compiled VU kernels (falls back to the NumPy path)
+try:
+    import numba
+    NUMBA_OK = True
+except Exception:
+    NUMBA_OK = False
+
+
+def _jit(fn, **opts):
+    """numba.njit(fn), using the on-disk cache when the install dir allows it (frozen/read-only
+    builds fail at decoration); None if numba can't take the function at all."""
+    for cache in (True, False):
+        try:
+            return numba.njit(cache=cache, **opts)(fn)
+        except Exception:
+            pass
+    return None
+
 LOG_PATH = "vortex_log.txt"
 LOG_MAX_BYTES = 2 * 1024 * 1024  # 2 MB
 LOG_BACKUP_COUNT = 3
-_LOG_LOCK = threading.Lock()
+LOG_ROTATE_CHECK_EVERY = 200  # lines written between size checks
+LOG_VIEW_MAX_LINES = 5000
 
 # Qt scaling knobs
 os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
@@ -73,6 +99,14 @@ os.environ["QT_SCALE_FACTOR"] = "0.7"
 UI_SCALE = 1
 def S(x): return int(round(x * UI_SCALE))
 
+# Scaled widget sizes, resolved once
+WINDOW_W, WINDOW_H = S(1280), S(720)
+TITLE_H, TITLE_FONT_PX = S(42), S(18)
+MENU_W, MENU_BTN_H, BRAND_FONT_PX = S(270), S(46), S(30)
+LCD_W, LCD_H = S(450), S(129)
+MAT_W, MAT_H = S(440), S(132)
+SEND_BTN = S(46)
+
 
 def _now_ts():
     return time.strftime("%Y-%m-%d %H:%M:%S")
@@ -120,7 +154,67 @@ def rotate_log_if_needed():
 
 
 # ---------------- Logging ----------------
-_LOG_QUEUE = Queue()
+_LOG_QUEUE = deque(maxlen=LOG_VIEW_MAX_LINES)  # GUI log view; append/popleft are thread-safe
+_LOG_LISTENERS = []        # called inline by _log on the calling thread, once per line; keep them thread-safe and cheap
+_LOG_FILE_QUEUE = Queue()  # file writer thread (None = stop)
+
+# 1 = normal, 2 = also trace every non-VU serial TX line
+try:
+    _LOG_LEVEL = int(os.environ.get("VORTEX_LOG_LEVEL", "1"))
+except ValueError:
+    _LOG_LEVEL = 1
+
+
+class _LogWriter(threading.Thread):
+    """Owns the open log file. Producers only enqueue; writes are batched here."""
+
+    def __init__(self):
+        super().__init__(name="log_writer", daemon=True)
+        self._f = None
+        self._since_rotate = 0
+
+    def _close(self):
+        try:
+            if self._f is not None:
+                self._f.close()
+        except Exception:
+            pass
+        self._f = None
+
+    def _reopen(self):
+        # File must be closed before rotating (os.replace fails on open files on Windows)
+        self._close()
+        rotate_log_if_needed()
+        self._f = open(LOG_PATH, "a", encoding="utf-8")
+        self._since_rotate = 0
+
+    def run(self):
+        while True:
+            batch = [_LOG_FILE_QUEUE.get()]
+            try:
+                while True:
+                    batch.append(_LOG_FILE_QUEUE.get_nowait())
+            except Empty:
+                pass
+
+            stop = None in batch
+            try:
+                if self._f is None or self._since_rotate >= LOG_ROTATE_CHECK_EVERY:
+                    self._reopen()
+                self._f.write("".join(s for s in batch if s is not None))
+                self._f.flush()
+                self._since_rotate += len(batch)
+            except Exception:
+                self._close()
+
+            if stop:
+                self._close()
+                return
+
+
+_LOG_WRITER = _LogWriter()
+_LOG_WRITER.start()
+
 
 def _log(msg: str):
     s = f"[{_now_ts()}] {msg}"
@@ -130,25 +224,29 @@ def _log(msg: str):
         pass
 
     try:
-        with _LOG_LOCK:
-            rotate_log_if_needed()
-            with open(LOG_PATH, "a", encoding="utf-8") as f:
-                f.write(s + "\n")
+        _LOG_FILE_QUEUE.put_nowait(s + "\n")
     except Exception:
         pass
 
-    try:
-        _LOG_QUEUE.put_nowait(s)
-    except Exception:
-        pass
+    _LOG_QUEUE.append(s)
+
+    for cb in _LOG_LISTENERS:
+        try:
+            cb()
+        except Exception:
+            pass
+
+
+def _logd(msg: str):
+    if _LOG_LEVEL >= 2:
+        _log(msg)
 
 
 def report_exception(tag: str):
     import traceback
     _log(f"{tag}: exception")
     try:
-        with open(LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(traceback.format_exc() + "\n")
+        _LOG_FILE_QUEUE.put_nowait(traceback.format_exc() + "\n")
     except Exception:
         pass
 
@@ -167,6 +265,11 @@ sys.excepthook = _sys_exhook
 @atexit.register
 def _on_atexit():
     _log("process exiting (atexit). see vortex_log.txt")
+    try:
+        _LOG_FILE_QUEUE.put_nowait(None)
+        _LOG_WRITER.join(timeout=1.0)
+    except Exception:
+        pass
 
 
 # ---------------- Serial ----------------
@@ -180,30 +283,60 @@ def find_serial_port():
     return ports[0].device
 
 
+# Drop control chars (newline becomes a space) before the printable-ASCII check
+_CTRL_DROP = {i: None for i in range(32)}
+_CTRL_DROP[0x7F] = None
+_CTRL_DROP[ord('\n')] = ord(' ')
+
 def clean_string(text):
     if not isinstance(text, str):
         text = str(text)
-    text = text.replace('\x00', '').replace('\r', '').replace('\n', ' ')
+    text = text.translate(_CTRL_DROP)
+    if text.isascii():
+        return text.strip()
     return ''.join(c for c in unidecode(text) if 32 <= ord(c) <= 126).strip()
 
+# ASCII digits for channel levels 0..100 (CH: frames)
+_INT_STR = [str(i).encode("ascii") for i in range(101)]
+
 
 class SerialLink:
+    TX_QUEUE_MAX = 256
+
     def __init__(self):
         self.ser = None
         self.lock = threading.Lock()
         self.last_tx = 0.0
+        self._tx_q = Queue(maxsize=self.TX_QUEUE_MAX)
+        self._tx_thread = None
+        self._last_port = None
 
     def connect(self):
         try:
-            com_port = find_serial_port()
-            if not com_port:
-                _log("No serial port found")
-                self.ser = None
-                return False
-            _log(f"Connecting to {com_port}")
-            self.ser = serial.Serial(com_port, 115200, timeout=1)
+            ser = None
+            last_port = com_port = self._last_port
+            if com_port:
+                # Reopen the last good port before enumerating every COM device
+                try:
+                    _log(f"Connecting to {com_port}")
+                    ser = serial.Serial(com_port, 115200, timeout=1)
+                except Exception as e:
+                    _log(f"Reopen of {com_port} failed: {e}; rescanning")
+                    ser = None
+            if ser is None:
+                com_port = find_serial_port()
+                if not com_port:
+                    _log("No serial port found")
+                    self.ser = None
+                    return False
+                if com_port != last_port:
+                    _log(f"Connecting to {com_port}")
+                ser = serial.Serial(com_port, 115200, timeout=1)
+            self.ser = ser
+            self._last_port = com_port
             time.sleep(2)
             _log("Serial connection established")
+            self._start_tx_thread()
             return True
         except Exception as e:
             _log(f"Serial connection failed: {e}")
@@ -213,6 +346,59 @@ class SerialLink:
     def is_open(self):
         return bool(self.ser and self.ser.is_open)
 
+    def _start_tx_thread(self):
+        if self._tx_thread is None or not self._tx_thread.is_alive():
+            self._tx_thread = threading.Thread(target=self._tx_loop, name="serial_tx", daemon=True)
+            self._tx_thread.start()
+
+    def _take_pending(self, batch):
+        try:
+            while True:
+                batch.append(self._tx_q.get_nowait())
+        except Empty:
+            pass
+        return batch
+
+    def _write_batch(self, batch):
+        """Writes queued (payload, kind) items in one write(). Caller holds self.lock."""
+        # Only the newest V:/CH: frame of a batch is worth sending
+        seen = set()
+        chunks = []
+        need_flush = False
+        for payload, kind in reversed(batch):
+            if kind:
+                if kind in seen:
+                    continue
+                seen.add(kind)
+            else:
+                need_flush = True
+            chunks.append(payload)
+        chunks.reverse()
+
+        if not self.is_open():
+            return False
+        try:
+            self.ser.write(b"".join(chunks))
+            if need_flush:
+                self.ser.flush()
+            self.last_tx = time.time()
+            return True
+        except Exception as e:
+            _log(f"Serial send error: {e}")
+            return False
+
+    def _tx_loop(self):
+        while True:
+            batch = self._take_pending([self._tx_q.get()])
+            stop = None in batch  # close() asks us to finish what we hold and exit
+            if stop:
+                batch = [item for item in batch if item is not None]
+            if batch:
+                with self.lock:
+                    self._write_batch(batch)
+            if stop:
+                return
+
     def send_line(self, line: str) -> bool:
         if not self.is_open():
             return False
@@ -222,19 +408,36 @@ class SerialLink:
             s += "\n"
 
         # High frequency data
-        is_vu = s.startswith("V:") or s.startswith("CH:")
+        if s.startswith("V:"):
+            kind = "V"
+        elif s.startswith("CH:"):
+            kind = "CH"
+        else:
+            kind = None
+            _logd(f"TX: {s.strip()}")
 
-        with self.lock:
-            try:
-                self.ser.write(s.encode("ascii", errors="ignore"))
-                if not is_vu:
-                    self.ser.flush()
-                    _log(f"TX: {s.strip()}")
-                self.last_tx = time.time()
-                return True
-            except Exception as e:
-                _log(f"Serial send error: {e}")
-                return False
+        return self._enqueue(s.encode("ascii", errors="ignore"), kind)
+
+    def send_raw(self, payload: bytes, kind=None) -> bool:
+        """Queues an already-encoded, newline-terminated ASCII line as-is."""
+        if not self.is_open():
+            return False
+        return self._enqueue(payload, kind)
+
+    def _enqueue(self, payload: bytes, kind) -> bool:
+        item = (payload, kind)
+        try:
+            self._tx_q.put_nowait(item)
+            return True
+        except Full:
+            if kind:
+                return False  # a newer frame follows shortly
+        try:
+            self._tx_q.put(item, timeout=0.5)
+            return True
+        except Full:
+            _log("Serial TX queue full; dropping line")
+            return False
 
     def reset(self):
         if not self.is_open():
@@ -262,12 +465,24 @@ class SerialLink:
             return False
 
     def close(self):
-        try:
-            if self.ser:
-                self.ser.close()
-        except Exception:
-            pass
-        self.ser = None
+        # Stop the TX thread first: a batch it already dequeued would be lost once the port closes
+        thr = self._tx_thread
+        if thr is not None and thr.is_alive():
+            try:
+                self._tx_q.put(None, timeout=0.5)
+                thr.join(timeout=2.0)
+            except Full:
+                pass
+        with self.lock:
+            pending = self._take_pending([])
+            if pending:
+                self._write_batch(pending)
+            try:
+                if self.ser:
+                    self.ser.close()
+            except Exception:
+                pass
+            self.ser = None
 
 
 # ---------------- LCD emulator (16x2 HD44780-ish) ----------------
@@ -306,20 +521,24 @@ _FONT5X7 = [
     0x00,0x41,0x36,0x08,0x00,  0x08,0x04,0x08,0x10,0x08,  0x00,0x00,0x00,0x00,0x00,
 ]
 
-def _glyph_cols_for_ascii(ch: int):
-    if ch < 0x20 or ch > 0x7F:
-        ch = 0x20
-    i = (ch - 0x20) * 5
-    return _FONT5X7[i:i+5]
-
-def _cgram_to_cols(byte_rows_8):
-    cols = [0]*5
-    for y in range(8):
-        row = int(byte_rows_8[y]) & 0x1F
-        for x in range(5):
-            if row & (1 << (4-x)):
-                cols[x] |= (1 << y)
-    return cols
+# One 5-column glyph per row, indexed by (ch - 0x20)
+_FONT5X7_ARR = np.frombuffer(bytes(_FONT5X7), dtype=np.uint8).reshape(96, 5)
+
+# Glyph columns for every byte code, so a DDRAM row decodes with one np.take; codes outside
+# 0x20..0x7F render as space (all-zero columns)
+_GLYPH_COLS_LUT = np.zeros((256, 5), dtype=np.uint8)
+_GLYPH_COLS_LUT[0x20:0x80] = _FONT5X7_ARR
+
+_CGRAM_SHIFTS = np.arange(4, -1, -1, dtype=np.int32)      # column x -> bit (4-x) of a row
+_BIT_WEIGHTS = (1 << np.arange(8, dtype=np.int32))          # row y -> bit y of a column
+
+# Keyed by CGRAM content, so a rewritten glyph just misses instead of needing invalidation
+@functools.lru_cache(maxsize=16)
+def _cgram_to_cols(cgram_bytes: bytes):
+    """(8, 5) glyph columns for all 8 CGRAM glyphs, given their 64 row bytes."""
+    rows = np.frombuffer(cgram_bytes, dtype=np.uint8).reshape(8, 8).astype(np.int32) & 0x1F
+    bits = (rows[:, :, None] >> _CGRAM_SHIFTS) & 1                       # (glyph, y, x)
+    return np.einsum("y,gyx->gx", _BIT_WEIGHTS, bits).astype(np.uint8)
 
 _VISIT_BAR_CHARS = [
     [0,0,0,0,0,0,0,0],
@@ -343,17 +562,16 @@ _SYSTEM_ICONS = {
     2: [0b00000,0b00000,0b11111,0b11111,0b11111,0b10101,0b00000,0b00000],
 }
 
-def pad16(s: str) -> str:
-    s = s or ""
-    if len(s) > 16:
-        s = s[:16]
-    return s + (" " * (16 - len(s)))
+def _pad16b(s: str, n: int = 16):
+    """s as n space-padded ASCII codes (uint8 array view)."""
+    return np.frombuffer((s or "").encode("ascii", "replace")[:n].ljust(n, b" "), dtype=np.uint8)
 
 class LcdState:
     def __init__(self):
         self.mode = "VISIT"
-        self.ddram = [[0x20]*16, [0x20]*16]
-        self.cgram = {i: _VISIT_BAR_CHARS[i][:] for i in range(8)}
+        # DDRAM codes and CGRAM glyph rows as flat uint8 arrays, read as-is by the preview widget
+        self.ddram = np.full((2, 16), 0x20, dtype=np.uint8)
+        self.cgram = np.array(_VISIT_BAR_CHARS, dtype=np.uint8)
         self.visit_anim_active = False
         self.box_step = 0
         self.last_anim = 0.0
@@ -362,12 +580,14 @@ class LcdState:
         self.scroll_bottom = ""
         self.scroll_i_top = 0
         self.scroll_i_bottom = 0
+        self._scroll_dq = {"scroll_i_top": deque(), "scroll_i_bottom": deque()}
         self.last_scroll = 0.0
         self.scroll_interval = 0.75
         self.volume_overlay = False
         self._vol_until = 0.0
         self.last_visit_astro = 0
         self.last_visit_core = 0
+        self.rev = 0  # bumped whenever ddram/cgram may have changed
 
     def set_mode_by_num(self, m: int):
         if m == 1: self.enter_visit()
@@ -378,12 +598,17 @@ class LcdState:
         elif m == 8: self.enter_screen()
 
     def clear(self):
-        self.ddram = [[0x20]*16, [0x20]*16]
+        self.ddram.fill(0x20)
+
+    def _load_cgram(self, glyphs):
+        self.cgram.fill(0)
+        for k, v in glyphs.items():
+            self.cgram[k] = v
 
     def enter_visit(self):
         self.mode = "VISIT"
         self.clear()
-        self.cgram = {i: _VISIT_BAR_CHARS[i][:] for i in range(8)}
+        self.cgram[:] = _VISIT_BAR_CHARS
         self.visit_anim_active = False
         self.box_step = 0
         self.draw_visit_header_counts(0, 0)
@@ -391,68 +616,50 @@ class LcdState:
     def draw_visit_header_counts(self, astro: int, core: int):
         self.last_visit_astro = int(astro)
         self.last_visit_core = int(core)
-        top = pad16("Live Visit Count")
-        bottom15 = f"ARI:{astro} CC:{core}"
-        if len(bottom15) > 15:
-            bottom15 = bottom15[:15]
-        bottom15 = bottom15 + (" " * (15 - len(bottom15)))
-        self.write_line(0, top)
-        for i, ch in enumerate(bottom15):
-            self.ddram[1][i] = ord(ch)
+        self.write_line(0, "Live Visit Count")
+        self.ddram[1][:15] = _pad16b(f"ARI:{astro} CC:{core}", 15)
         self.ddram[1][15] = self.box_step
 
     def enter_music(self):
         self.mode = "MUSIC"
         self.clear()
-        for i in range(8):
-            self.cgram[i] = [0]*8
-        for k, v in _MUSIC_ICONS.items():
-            self.cgram[k] = v[:]
+        self._load_cgram(_MUSIC_ICONS)
         self.write_icon_prefix_line(0, 0, "Music Mode")
         self.write_icon_prefix_line(1, 1, "Loading...")
 
     def enter_clock(self):
         self.mode = "CLOCK"
         self.clear()
-        self.write_line(0, pad16("Clock Mode"))
-        self.write_line(1, pad16("Loading..."))
+        self.write_line(0, "Clock Mode")
+        self.write_line(1, "Loading...")
 
     def enter_text(self):
         self.mode = "TEXT"
         self.clear()
-        self.write_line(0, pad16("Text Mode"))
-        self.write_line(1, pad16("Loading..."))
+        self.write_line(0, "Text Mode")
+        self.write_line(1, "Loading...")
 
     def enter_system(self):
         self.mode = "SYSTEM"
         self.clear()
-        for i in range(8):
-            self.cgram[i] = [0]*8
-        for k, v in _SYSTEM_ICONS.items():
-            self.cgram[k] = v[:]
+        self._load_cgram(_SYSTEM_ICONS)
         self.write_icon_prefix_line(0, 0, "System Mode")
         self.write_icon_prefix_line(1, 2, "Loading...")
 
     def enter_screen(self):
         self.mode = "SCREEN"
         self.clear()
-        self.write_line(0, pad16("Screen Mirror"))
-        self.write_line(1, pad16("Running"))
+        self.write_line(0, "Screen Mirror")
+        self.write_line(1, "Running")
 
     def write_line(self, row: int, text16: str):
-        text16 = pad16(text16)
-        for i, ch in enumerate(text16[:16]):
-            self.ddram[row][i] = ord(ch)
+        self.ddram[row][:] = _pad16b(text16)
 
     def write_icon_prefix_line(self, row: int, icon_index: int, text: str):
-        t = (text or "")
-        if len(t) > 14:
-            t = t[:14]
-        t = t + (" " * (14 - len(t)))
-        self.ddram[row][0] = int(icon_index) & 0xFF
-        self.ddram[row][1] = ord(" ")
-        for i in range(14):
-            self.ddram[row][i+2] = ord(t[i])
+        line = self.ddram[row]
+        line[0] = int(icon_index) & 0xFF
+        line[1] = 0x20
+        line[2:] = _pad16b(text, 14)
 
     def scroll_text_line_icon(self, row: int, text: str, idx_attr: str, icon_index: int):
         avail = 14
@@ -462,141 +669,140 @@ class LcdState:
             self.write_icon_prefix_line(row, icon_index, text)
             setattr(self, idx_attr, 0)
             return
-        buf = text + "    "
-        pos = idx % len(buf)
-        seg = "".join(buf[(pos+i) % len(buf)] for i in range(avail))
+        dq = self._scroll_dq[idx_attr]
+        seg = "".join(itertools.islice(dq, avail))
+        dq.rotate(-1)
         self.write_icon_prefix_line(row, icon_index, seg)
         setattr(self, idx_attr, idx + 1)
 
     def handle_cmd(self, cmd: str):
-        cmd = cmd.strip()
-        if cmd.startswith("MODE:"):
-            try:
-                self.set_mode_by_num(int(cmd[5:]))
-            except Exception:
-                pass
+        tag, sep, body = cmd.strip().partition(":")
+        if not sep:
             return
+        handler = self._HANDLERS.get(tag)
+        if handler is not None:
+            handler(self, body)
+            self.rev += 1
 
-        if cmd.startswith("LIVE:"):
-            try:
-                comma = cmd.find(",")
-                astro = int(cmd[5:comma])
-                core = int(cmd[comma+1:])
-                if self.mode == "VISIT":
-                    self.draw_visit_header_counts(astro, core)
-                    self.box_step = 0
-                    self.visit_anim_active = True
-                    self.last_anim = time.time()
-                    self.ddram[1][15] = self.box_step
-            except Exception:
-                pass
-            return
+    def _cmd_mode(self, body: str):
+        try:
+            self.set_mode_by_num(int(body))
+        except Exception:
+            pass
 
-        if cmd.startswith("CLOCK:"):
-            try:
-                body = cmd[6:]
-                if "|" in body:
-                    top, bottom = body.split("|", 1)
-                else:
-                    top, bottom = body, ""
-                top = pad16(clean_string(top))
-                bottom = pad16(clean_string(bottom))
-                if self.mode == "CLOCK":
-                    self.write_line(0, top)
-                    self.write_line(1, bottom)
-            except Exception:
-                pass
-            return
+    def _cmd_live(self, body: str):
+        try:
+            comma = body.find(",")
+            astro = int(body[:comma])
+            core = int(body[comma+1:])
+            if self.mode == "VISIT":
+                self.draw_visit_header_counts(astro, core)
+                self.box_step = 0
+                self.visit_anim_active = True
+                self.last_anim = time.monotonic()
+                self.ddram[1][15] = self.box_step
+        except Exception:
+            pass
 
-        if cmd.startswith("MUSIC:"):
-            try:
-                body = cmd[6:]
-                if "|" in body:
-                    top, bottom = body.split("|", 1)
-                else:
-                    top, bottom = body, ""
-                top = clean_string(top) or "Unknown Title"
-                bottom = clean_string(bottom) or "Unknown Artist"
-                self.scroll_top = top
-                self.scroll_bottom = bottom
-                self.scroll_i_top = 0
-                self.scroll_i_bottom = 0
-                self.last_scroll = time.time()
-                if self.mode == "MUSIC" and not self.volume_overlay:
-                    self.write_icon_prefix_line(0, 0, self.scroll_top[:15])
-                    self.write_icon_prefix_line(1, 1, self.scroll_bottom[:15])
-            except Exception:
-                pass
-            return
+    def _cmd_clock(self, body: str):
+        try:
+            if "|" in body:
+                top, bottom = body.split("|", 1)
+            else:
+                top, bottom = body, ""
+            top = clean_string(top)
+            bottom = clean_string(bottom)
+            if self.mode == "CLOCK":
+                self.write_line(0, top)
+                self.write_line(1, bottom)
+        except Exception:
+            pass
 
-        if cmd.startswith("TEXT:"):
-            try:
-                txt = clean_string(cmd[5:])
-                if self.mode == "TEXT":
-                    top = pad16(txt[:16])
-                    bottom = pad16(txt[16:32]) if len(txt) > 16 else pad16("")
-                    self.write_line(0, top)
-                    self.write_line(1, bottom)
-            except Exception:
-                pass
-            return
+    def _cmd_music(self, body: str):
+        try:
+            if "|" in body:
+                top, bottom = body.split("|", 1)
+            else:
+                top, bottom = body, ""
+            top = clean_string(top) or "Unknown Title"
+            bottom = clean_string(bottom) or "Unknown Artist"
+            self.scroll_top = top
+            self.scroll_bottom = bottom
+            self.scroll_i_top = 0
+            self.scroll_i_bottom = 0
+            self._scroll_dq = {"scroll_i_top": deque(top + "    "), "scroll_i_bottom": deque(bottom + "    ")}
+            self.last_scroll = time.monotonic()
+            if self.mode == "MUSIC" and not self.volume_overlay:
+                self.write_icon_prefix_line(0, 0, self.scroll_top[:15])
+                self.write_icon_prefix_line(1, 1, self.scroll_bottom[:15])
+        except Exception:
+            pass
 
-        if cmd.startswith("VOL:"):
-            try:
-                body = cmd[4:]
-                if "|" in body:
-                    pct_s, dev = body.split("|", 1)
-                else:
-                    pct_s, dev = body.strip(), ""
+    def _cmd_text(self, body: str):
+        try:
+            txt = clean_string(body)
+            if self.mode == "TEXT":
+                self.write_line(0, txt[:16])
+                self.write_line(1, txt[16:32])
+        except Exception:
+            pass
 
-                pct_s = clean_string(pct_s)
-                dev = clean_string(dev)
+    def _cmd_vol(self, body: str):
+        try:
+            if "|" in body:
+                pct_s, dev = body.split("|", 1)
+            else:
+                pct_s, dev = body.strip(), ""
 
-                for i in range(8):
-                    self.cgram[i] = [0]*8
-                for k, v in _MUSIC_ICONS.items():
-                    self.cgram[k] = v[:]
+            pct_s = clean_string(pct_s)
+            dev = clean_string(dev)
 
-                self.volume_overlay = True
-                self._vol_until = time.time() + 1.5
+            self._load_cgram(_MUSIC_ICONS)
 
-                line0 = f"Volume: {pct_s}"
-                line1 = dev or ""
-                self.write_icon_prefix_line(0, 2, line0)
-                self.write_icon_prefix_line(1, 3, line1)
-            except Exception:
-                pass
-            return
+            self.volume_overlay = True
+            self._vol_until = time.monotonic() + 1.5
+
+            line0 = f"Volume: {pct_s}"
+            line1 = dev or ""
+            self.write_icon_prefix_line(0, 2, line0)
+            self.write_icon_prefix_line(1, 3, line1)
+        except Exception:
+            pass
+
+    _HANDLERS = {
+        "MODE": _cmd_mode,
+        "LIVE": _cmd_live,
+        "CLOCK": _cmd_clock,
+        "MUSIC": _cmd_music,
+        "TEXT": _cmd_text,
+        "VOL": _cmd_vol,
+    }
 
     def tick(self):
-        now = time.time()
+        now = time.monotonic()
 
         if self.volume_overlay and self._vol_until and now >= self._vol_until:
             self.volume_overlay = False
 
             if self.mode == "VISIT":
-                self.cgram = {i: _VISIT_BAR_CHARS[i][:] for i in range(8)}
+                self.cgram[:] = _VISIT_BAR_CHARS
                 self.draw_visit_header_counts(self.last_visit_astro, self.last_visit_core)
                 self.ddram[1][15] = self.box_step
 
             elif self.mode == "MUSIC":
-                for i in range(8):
-                    self.cgram[i] = [0]*8
-                for k, v in _MUSIC_ICONS.items():
-                    self.cgram[k] = v[:]
+                self._load_cgram(_MUSIC_ICONS)
                 self.write_icon_prefix_line(0, 0, self.scroll_top[:14])
                 self.write_icon_prefix_line(1, 1, self.scroll_bottom[:14])
                 self.last_scroll = now
 
             elif self.mode == "SYSTEM":
-                for i in range(8):
-                    self.cgram[i] = [0]*8
-                for k, v in _SYSTEM_ICONS.items():
-                    self.cgram[k] = v[:]
+                self._load_cgram(_SYSTEM_ICONS)
+            self.rev += 1
 
         if self.mode == "VISIT" and self.visit_anim_active:
             if (now - self.last_anim) >= self.anim_interval:
                 self.ddram[1][15] = self.box_step
+                self.rev += 1
                 if self.box_step < 7:
                     self.box_step += 1
                     self.last_anim = now
@@ -608,29 +814,34 @@ class LcdState:
                 self.scroll_text_line_icon(0, self.scroll_top, "scroll_i_top", 0)
                 self.scroll_text_line_icon(1, self.scroll_bottom, "scroll_i_bottom", 1)
                 self.last_scroll = now
+                self.rev += 1
 
 
 # ---------------- Dot matrix state (32x8) ----------------
+# Bar height needed to light each row (row 0 is the top of the matrix)
+_VU_ROW_HEIGHTS = np.arange(7, -1, -1, dtype=np.int8)[:, None]
+
 class MatrixState:
     def __init__(self):
         self.mode = "NONE"
-        self.pixels = [[0]*32 for _ in range(8)]
-        self.vu_levels = [0]*32
+        self.pixels = np.zeros((8, 32), dtype=np.uint8)
+        self.vu_levels = np.zeros(32, dtype=np.int8)
         self._last_decay = time.time()
+        self.rev = 0  # bumped on every pixels write
 
     def clear(self):
-        self.pixels = [[0]*32 for _ in range(8)]
+        self.pixels.fill(0)
+        self.rev += 1
 
     def _render_vu_pixels(self):
-        self.clear()
-        for x in range(32):
-            h = self.vu_levels[x]
-            for y in range(8):
-                self.pixels[7-y][x] = 1 if y < h else 0
+        np.less(_VU_ROW_HEIGHTS, self.vu_levels[None, :], out=self.pixels, casting="unsafe")
+        self.rev += 1
 
     def apply_vu(self, levels_0_8):
         self.mode = "VU"
-        self.vu_levels = [max(0, min(8, int(v))) for v in levels_0_8[:32]] + [0]*(32-len(levels_0_8[:32]))
+        lv = np.clip(np.asarray(levels_0_8[:32], dtype=np.int16), 0, 8)
+        self.vu_levels[:lv.size] = lv
+        self.vu_levels[lv.size:] = 0
         self._render_vu_pixels()
         self._last_decay = time.time()
 
@@ -638,16 +849,12 @@ class MatrixState:
         if len(hex_payload) < 8*8:
             return
         self.mode = "FB"
-        self.clear()
         try:
-            rows = [int(hex_payload[i*8:(i+1)*8], 16) for i in range(8)]
-            for y in range(8):
-                row = rows[y]
-                for x in range(32):
-                    bit = (row >> (31-x)) & 1
-                    self.pixels[y][x] = 1 if bit else 0
+            raw = np.frombuffer(bytes.fromhex(hex_payload[:64]), dtype=np.uint8)
+            self.pixels[:] = np.unpackbits(raw.reshape(8, 4), axis=1)
+            self.rev += 1
         except Exception:
-            pass
+            self.clear()
 
     def tick_decay(self, enabled: bool, step_ms: int = 90):
         if self.mode != "VU":
@@ -659,118 +866,301 @@ class MatrixState:
         if (now - self._last_decay) * 1000.0 < step_ms:
             return
         self._last_decay = now
-        changed = False
-        for i in range(32):
-            if self.vu_levels[i] > 0:
-                self.vu_levels[i] -= 1
-                changed = True
-        if changed:
+        active = self.vu_levels > 0
+        if active.any():
+            np.subtract(self.vu_levels, 1, out=self.vu_levels, where=active)
             self._render_vu_pixels()
 
 
 # ---------------- Native worker processes ----------------
 def _volume_worker(out_q, stop_ev):
-    """Runs in a child process. Sends tuples: ('VOL', pct:int, devname:str)."""
-    pythoncom = None
+    """
+    Runs in a child process. Sends tuples: ('VOL', pct:int, devname:str).
+    Volume and default-device changes arrive as COM notifications; polls if those can't be registered.
+    """
+    # COM is initialized by the pythoncom/comtypes imports (STA via sys.coinit_flags)
+    try:
+        import pythoncom
+        import re as _re
+        from ctypes import POINTER, cast
+        from comtypes import CLSCTX_ALL, COMObject
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+    except Exception:
+        return
+
+    EDF_RENDER, EROLE_MULTIMEDIA = 0, 1
+    POLL_DT = 0.20
+
+    # Written by the COM callbacks, consumed by the loop below
+    changes = {"pct": None, "device": False}
+
+    vol_cb = dev_cb = None
     try:
         try:
-            import pythoncom as _pc
-            pythoncom = _pc
-            pythoncom.CoInitializeEx(2)  # STA
+            from pycaw.api.endpointvolume import IAudioEndpointVolumeCallback
+            from pycaw.api.mmdeviceapi import IMMNotificationClient
         except Exception:
-            return
+            from pycaw.pycaw import IAudioEndpointVolumeCallback, IMMNotificationClient
+
+        class VolumeCallback(COMObject):
+            _com_interfaces_ = [IAudioEndpointVolumeCallback]
 
+            def OnNotify(self, pNotify):
+                try:
+                    changes["pct"] = int(round(float(pNotify.contents.fMasterVolume) * 100.0))
+                except Exception:
+                    pass
+                return 0
+
+        class DeviceCallback(COMObject):
+            _com_interfaces_ = [IMMNotificationClient]
+
+            def OnDefaultDeviceChanged(self, flow, role, device_id):
+                if flow == EDF_RENDER and role == EROLE_MULTIMEDIA:
+                    changes["device"] = True
+                return 0
+
+            def OnDeviceStateChanged(self, device_id, new_state): return 0
+            def OnDeviceAdded(self, device_id): return 0
+            def OnDeviceRemoved(self, device_id): return 0
+            def OnPropertyValueChanged(self, device_id, key): return 0
+
+        vol_cb, dev_cb = VolumeCallback(), DeviceCallback()
+    except Exception:
+        vol_cb = dev_cb = None
+
+    def friendly_name(dev):
         try:
-            import re as _re
-            from ctypes import POINTER, cast
-            from comtypes import CLSCTX_ALL
-            from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+            did = dev.GetId()
+            for m in AudioUtilities.GetAllDevices():
+                mid = getattr(m, "id", None) or (m.GetId() if hasattr(m, "GetId") else None)
+                if mid and did and mid == did:
+                    nm = getattr(m, "FriendlyName", None) or "Default"
+                    return _re.sub(r"\s*\([^)]*\)\s*$", "", nm).strip() or "Default"
         except Exception:
-            return
+            pass
+        return "Default"
+
+    def get_default():
+        enum = AudioUtilities.GetDeviceEnumerator()
+        dev = enum.GetDefaultAudioEndpoint(EDF_RENDER, EROLE_MULTIMEDIA)
+        vol = cast(
+            dev.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None),
+            POINTER(IAudioEndpointVolume),
+        )
+        return enum, dev, vol, dev.GetId()
+
+    def watch_volume(vol):
+        try:
+            vol.RegisterControlChangeNotify(vol_cb)
+            return True
+        except Exception:
+            return False
 
-        EDF_RENDER, EROLE_MULTIMEDIA = 0, 1
+    def unwatch_volume(vol):
+        try:
+            vol.UnregisterControlChangeNotify(vol_cb)
+        except Exception:
+            pass
+
+    enum = vol = None
+    events = False
+    try:
+        enum, dev, vol, dev_id = get_default()
+        name = friendly_name(dev)
 
-        def friendly_name(dev):
+        if vol_cb is not None and watch_volume(vol):
             try:
-                did = dev.GetId()
-                for m in AudioUtilities.GetAllDevices():
-                    mid = getattr(m, "id", None) or (m.GetId() if hasattr(m, "GetId") else None)
-                    if mid and did and mid == did:
-                        nm = getattr(m, "FriendlyName", None) or "Default"
-                        return _re.sub(r"\s*\([^)]*\)\s*$", "", nm).strip() or "Default"
+                enum.RegisterEndpointNotificationCallback(dev_cb)
+                events = True
             except Exception:
-                pass
-            return "Default"
-
-        def get_default():
-            enum = AudioUtilities.GetDeviceEnumerator()
-            dev = enum.GetDefaultAudioEndpoint(EDF_RENDER, EROLE_MULTIMEDIA)
-            vol = cast(
-                dev.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None),
-                POINTER(IAudioEndpointVolume),
-            )
-            return enum, dev, vol, dev.GetId()
+                unwatch_volume(vol)
 
-        enum, dev, vol, dev_id = get_default()
-        name = friendly_name(dev)
         last_pct = None
         last_check = time.time()
-
-        POLL_DT = 0.20
+        read_now = True  # read the scalar directly after (re)binding
 
         while not stop_ev.is_set():
-            now = time.time()
+            pythoncom.PumpWaitingMessages()
 
-            if now - last_check >= 1.5:
-                last_check = now
-                try:
-                    _, _, _, id2 = get_default()
-                    if id2 != dev_id:
-                        enum, dev, vol, dev_id = get_default()
-                        name = friendly_name(dev)
-                        last_pct = None
-                except Exception:
+            rebind = changes["device"]
+            if not events:
+                now = time.time()
+                if now - last_check >= 1.5:
+                    last_check = now
                     try:
-                        enum, dev, vol, dev_id = get_default()
-                        name = friendly_name(dev)
-                        last_pct = None
+                        rebind = rebind or get_default()[3] != dev_id
                     except Exception:
-                        time.sleep(POLL_DT)
-                        continue
+                        rebind = True
+
+            if rebind:
+                changes["device"] = False
+                try:
+                    if events:
+                        unwatch_volume(vol)
+                    _, dev, vol, dev_id = get_default()
+                    changes["pct"] = None  # drop the old device's last callback value
+                    if events and not watch_volume(vol):
+                        events = False
+                    name = friendly_name(dev)
+                    last_pct = None
+                    read_now = True
+                except Exception:
+                    changes["device"] = True
+                    stop_ev.wait(POLL_DT)
+                    continue
 
             try:
-                scalar = float(vol.GetMasterVolumeLevelScalar())
-                pct = int(round(scalar * 100.0))
-                if pct != last_pct:
+                if events and not read_now:
+                    pct = changes["pct"]
+                else:
+                    pct = int(round(float(vol.GetMasterVolumeLevelScalar()) * 100.0))
+                    read_now = False
+                if pct is not None and pct != last_pct:
                     try:
                         out_q.put_nowait(("VOL", pct, name))
                     except Exception:
                         pass
                     last_pct = pct
             except Exception:
-                try:
-                    enum, dev, vol, dev_id = get_default()
-                    name = friendly_name(dev)
-                    last_pct = None
-                except Exception:
-                    pass
+                changes["device"] = True
 
-            time.sleep(POLL_DT)
+            if stop_ev.wait(POLL_DT):
+                break
 
     finally:
-        try:
-            if pythoncom is not None:
-                pythoncom.CoUninitialize()
-        except Exception:
-            pass
+        if events:
+            unwatch_volume(vol)
+            try:
+                enum.UnregisterEndpointNotificationCallback(dev_cb)
+            except Exception:
+                pass
+
+
+_GUID_TAIL_RE = re.compile(r"\}\.\{([0-9a-fA-F\-]+)\}")
+
+def _guid_tail(dev_id: str) -> str:
+    if not dev_id: return ""
+    m = _GUID_TAIL_RE.search(dev_id)
+    return m.group(1).lower() if m else dev_id.lower()
+
 
+_INV_LOG7 = np.float32(1.0 / np.log1p(6.0))  # normalizes log1p(6 * b) to 0..1 at b = 1
+
+
+def _vu_mono_peaks(x_multi, out_mono, out_peaks):
+    """Mono mix and per-channel |peak| of a (frames, channels) block, reading each sample once."""
+    n, c = x_multi.shape
+    inv_c = 1.0 / c
+    for j in range(c):
+        out_peaks[j] = 0.0
+    for i in range(n):
+        acc = 0.0
+        for j in range(c):
+            v = x_multi[i, j]
+            acc += v
+            av = abs(v)
+            if av > out_peaks[j]:
+                out_peaks[j] = av
+        out_mono[i] = acc * inv_c
+
+
+def _vu_band_power(X, band_starts, band_ends, tilt_gain, out):
+    """out[i] = sqrt(sum |X[k]|^2 over band i) * tilt_gain[i]"""
+    for i in range(out.shape[0]):
+        acc = 0.0
+        for k in range(band_starts[i], band_ends[i]):
+            acc += X[k].real * X[k].real + X[k].imag * X[k].imag
+        out[i] = np.sqrt(acc) * tilt_gain[i]
+
+
+def _vu_smooth(bands, smooth, noise_floor, agc_level, alpha_up, alpha_dn):
+    """Noise gate, AGC, log compression and attack/release EMA, updating smooth in place.
+    The scalars are narrowed once so the per-band math stays float32 like the arrays."""
+    inv_agc = np.float32(1.0 / (agc_level + 1e-9))
+    floor = np.float32(noise_floor)
+    a_up, a_dn = np.float32(alpha_up), np.float32(alpha_dn)
+    zero, six = np.float32(0.0), np.float32(6.0)
+    for i in range(bands.shape[0]):
+        b = (bands[i] - floor) * inv_agc
+        if b < zero:
+            b = zero
+        b = np.log1p(six * b) * _INV_LOG7
+        s = smooth[i]
+        a = a_up if b > s else a_dn
+        smooth[i] = s + (b - s) * a
+
+
+# The plain-Python kernels stay in place (and the worker uses its NumPy path) unless all three jit
+_VU_JIT = False
+if NUMBA_OK:
+    _jitted = [_jit(f, fastmath=True) for f in (_vu_mono_peaks, _vu_band_power, _vu_smooth)]
+    if all(_jitted):
+        _vu_mono_peaks, _vu_band_power, _vu_smooth = _jitted
+        _VU_JIT = True
+    del _jitted
+
+
+VU_SLOT_SIZE = 64  # shared memory block behind _VuSlot
+
+
+class _VuSlot:
+    """
+    Single-producer/single-consumer view over the VU shared memory block.
+    Layout: u32 vu_seq @0, 32 x u8 VU levels (0..8) @8, u32 ch_seq @40, u8 ch count @44, 6 x u8 CH levels (0..100) @48.
+    A seq is odd while its payload is being written; readers skip odd or changed seqs.
+    """
 
-def _vu_worker(out_q, stop_ev, enabled_ev, channel_enabled_ev, audio_mode_ev, rebind_ev):
+    def __init__(self, buf):
+        self._vu_seq = np.ndarray((1,), dtype=np.uint32, buffer=buf, offset=0)
+        self.vu = np.ndarray((32,), dtype=np.uint8, buffer=buf, offset=8)
+        self._ch_seq = np.ndarray((1,), dtype=np.uint32, buffer=buf, offset=40)
+        self._ch_n = np.ndarray((1,), dtype=np.uint8, buffer=buf, offset=44)
+        self.ch = np.ndarray((6,), dtype=np.uint8, buffer=buf, offset=48)
+
+    # Parity is forced rather than incremented, so a writer that died mid-write can't invert it
+    def write_vu(self, levels):
+        seq = int(self._vu_seq[0]) | 1
+        self._vu_seq[0] = seq
+        self.vu[:] = levels
+        self._vu_seq[0] = (seq + 1) & 0xFFFFFFFF
+
+    def write_ch(self, levels):
+        n = len(levels)
+        seq = int(self._ch_seq[0]) | 1
+        self._ch_seq[0] = seq
+        self.ch[:n] = levels
+        self._ch_n[0] = n
+        self._ch_seq[0] = (seq + 1) & 0xFFFFFFFF
+
+    def read_vu(self, last_seq):
+        """Returns (seq, copy of the levels), or (last_seq, None) if nothing new and complete."""
+        seq = int(self._vu_seq[0])
+        if seq == last_seq or seq & 1:
+            return last_seq, None
+        levels = self.vu.copy()
+        if int(self._vu_seq[0]) != seq:
+            return last_seq, None
+        return seq, levels
+
+    def read_ch(self, last_seq):
+        """Returns (seq, list of levels), or (last_seq, None) if nothing new and complete."""
+        seq = int(self._ch_seq[0])
+        if seq == last_seq or seq & 1:
+            return last_seq, None
+        levels = self.ch[:int(self._ch_n[0])].tolist()
+        if int(self._ch_seq[0]) != seq:
+            return last_seq, None
+        return seq, levels
+
+
+def _vu_worker(stop_ev, enabled_ev, channel_enabled_ev, audio_mode_ev, rebind_ev, vu_shm_name):
     """
     Runs in a child process.
-    Sends tuples: ('V', levels32_str) or ('CH', list_of_int_levels).
+    Publishes the latest VU levels and channel (CH) levels through the _VuSlot at `vu_shm_name`.
     """
     pythoncom = None
+    vu_shm = vu_slot = None
     try:
         try:
             import pythoncom as _pc
@@ -786,189 +1176,382 @@ def _vu_worker(out_q, stop_ev, enabled_ev, channel_enabled_ev, audio_mode_ev, re
         except Exception:
             return
 
-        def q_put_latest(q, item):
-            try: q.put_nowait(item); return
-            except: pass
+        # Imported on this thread so comtypes' import-time COM init doesn't clash with the MTA mic thread
+        try:
+            from comtypes import COMObject
+            from pycaw.pycaw import AudioUtilities
             try:
-                while True: q.get_nowait()
-            except: pass
-            try: q.put_nowait(item)
-            except: pass
+                from pycaw.api.mmdeviceapi import IMMNotificationClient
+            except Exception:
+                from pycaw.pycaw import IMMNotificationClient
+        except Exception:
+            COMObject = None
+
+        # Optional: planned FFTs (pyFFTW, then scipy.fft, then numpy)
+        try:
+            import pyfftw
+        except Exception:
+            pyfftw = None
+        try:
+            import scipy.fft as sp_fft
+        except Exception:
+            sp_fft = None
+
+        vu_shm = shared_memory.SharedMemory(name=vu_shm_name)
+        vu_slot = _VuSlot(vu_shm.buf)
 
         fps, frame_dt, blocksize, hop = 30.0, 1/30.0, 1024, 1024
-        window = np.hanning(blocksize).astype(np.float32)
+        # Per-block timing runs on integer monotonic_ns deltas
+        FRAME_DT_NS, CH_DT_NS, ZERO_HOLD_NS = int(frame_dt * 1e9), 50_000_000, 200_000_000
+        window = np.hanning(blocksize).astype(np.float32)  # float32 like the FFT input; built once
+
+        # Below ~8k points thread dispatch costs more than it saves, so small FFTs stay on one core
+        fft_threads = 2 if blocksize >= 8192 else 1
+
+        def make_rfft(n, rows=1):
+            """Returns (fft_in, run): fill the float32 (rows, n) buffer fft_in, then run() returns
+            the half spectrum of every row."""
+            if pyfftw is not None:
+                try:
+                    fft_in = pyfftw.empty_aligned((rows, n), dtype="float32")
+                    fft_out = pyfftw.empty_aligned((rows, n // 2 + 1), dtype="complex64")
+                    plan = pyfftw.FFTW(fft_in, fft_out, axes=(-1,), flags=("FFTW_MEASURE", "FFTW_DESTROY_INPUT"), threads=fft_threads)
+                    return fft_in, plan
+                except Exception:
+                    pass
+            fft_in = np.zeros((rows, n), dtype=np.float32)
+            if sp_fft is not None:
+                return fft_in, lambda: sp_fft.rfft(fft_in, axis=-1, workers=fft_threads)
+            return fft_in, lambda: np.fft.rfft(fft_in, axis=-1)
+
+        def next_fast_len(n):
+            """Smallest 2*3*5-smooth length >= n (pocketfft/FFTW fast path)."""
+            if sp_fft is not None:
+                return sp_fft.next_fast_len(n, real=True)
+            m = n
+            while True:
+                k = m
+                for p in (2, 3, 5):
+                    while k % p == 0:
+                        k //= p
+                if k == 1:
+                    return m
+                m += 1
+
+        def pick_batch(sr):
+            """Hops per record() call: the most (up to 4) that neither lowers the VU send rate
+            nor delays a frame by more than frame_dt."""
+            hop_dt = hop / float(sr)
+            def send_period(b):
+                return b * hop_dt * np.ceil(frame_dt / (b * hop_dt) - 1e-9)
+            best = 1
+            for b in range(2, 5):
+                if b * hop_dt <= frame_dt and send_period(b) <= send_period(1) + 1e-9:
+                    best = b
+            return best
+
+        n_fft = next_fast_len(blocksize)
+        fft_in, run_rfft = make_rfft(n_fft)
+        # Power spectrum scratch and its prefix sums (float64 so narrow bands survive the subtraction)
+        power = np.empty(n_fft // 2 + 1, dtype=np.float32)
+        power_im = np.empty_like(power)
+        power_csum = np.zeros(n_fft // 2 + 2, dtype=np.float64)
+        # Per-band scratch reused every frame
+        band_hi = np.empty(32, dtype=np.float64)
+        band_lo = np.empty(32, dtype=np.float64)
+        bands = np.empty(32, dtype=np.float32)
+        b_buf = np.empty(32, dtype=np.float32)
+        up_buf = np.empty(32, dtype=bool)
+        alpha_buf = np.empty(32, dtype=np.float32)
+        mono_buf = np.empty(0, dtype=np.float32)
+        peaks_buf = np.empty(0, dtype=np.float32)
+        lvl_buf = np.empty(32, dtype=np.float32)
+        agc_sel = np.empty(32, dtype=np.float32)
+        ch_scratch = np.zeros(6, dtype=np.float32)
+        # L, R, mic; boosted mic sensitivity for visibility
+        ch_gain_audio = np.array([1.0, 1.0, 1.5], dtype=np.float32)
+
+        def ch_percent(levels, gain):
+            """Scales 0..1 peaks in place, clipped to 0..100; returns them as uint8."""
+            np.multiply(levels, gain, out=levels)
+            np.clip(levels, 0.0, 1.0, out=levels)
+            np.multiply(levels, 100.0, out=levels)
+            return levels.astype(np.uint8)
 
         def _hz_to_mel(f): return 2595.0 * np.log10(1.0 + f / 700.0)
         def _mel_to_hz(m): return 700.0 * (10.0 ** (m / 2595.0) - 1.0)
 
         def build_bins(sr, n_bands=32):
-            freqs = np.fft.rfftfreq(blocksize, 1.0 / sr)
+            """Returns (band_starts, band_ends, centers): band i covers mag[band_starts[i]:band_ends[i]].
+            Bands too narrow to hold a bin take the single bin nearest their center."""
+            freqs = np.fft.rfftfreq(n_fft, 1.0 / sr)
             fmin, fmax = 40.0, min(20000.0, sr / 2.0)
             m_edges = np.linspace(_hz_to_mel(fmin), _hz_to_mel(fmax), n_bands + 1)
             edges = _mel_to_hz(m_edges)
-            bins, centers = [], []
-            for i in range(n_bands):
-                idx = np.where((freqs >= edges[i]) & (freqs < edges[i + 1]))[0]
-                if idx.size == 0:
-                    mid = _mel_to_hz((m_edges[i] + m_edges[i + 1]) * 0.5)
-                    idx = np.array([int(np.argmin(np.abs(freqs - mid)))], dtype=int)
-                bins.append(idx)
-                centers.append(_mel_to_hz((m_edges[i] + m_edges[i + 1]) * 0.5))
-            return bins, np.array(centers, dtype=np.float32)
+            centers = _mel_to_hz((m_edges[:-1] + m_edges[1:]) * 0.5)
+            starts = np.searchsorted(freqs, edges[:-1], side="left")
+            ends = np.searchsorted(freqs, edges[1:], side="left")
+            for i in np.flatnonzero(ends <= starts):
+                k = int(np.argmin(np.abs(freqs - centers[i])))
+                starts[i], ends[i] = k, k + 1
+            return starts.astype(np.intp), ends.astype(np.intp), centers.astype(np.float32)
+
+        # Endpoint enumeration is cached per default speaker; cleared on rebind
+        @functools.lru_cache(maxsize=1)
+        def loopback_for_speaker(spk_id: str, spk_name: str):
+            spk_guid = _guid_tail(spk_id)
+            candidates = sc.all_microphones(include_loopback=True)
+            loopbacks = [m for m in candidates if getattr(m, "isloopback", False)]
+            exact = [m for m in loopbacks if _guid_tail(getattr(m, "id", "") or "") == spk_guid]
+            name_match = [m for m in loopbacks if spk_name.lower() in (m.name or "").lower()]
+            pick = (exact or name_match or loopbacks)
+            return pick[0] if pick else None
 
-        import re as _re
         def pick_sc_loopback_once():
             try:
                 spk = sc.default_speaker()
                 if not spk: return None
-                def guid_tail(dev_id: str) -> str:
-                    if not dev_id: return ""
-                    m = _re.search(r"\}\.\{([0-9a-fA-F\-]+)\}", dev_id)
-                    return m.group(1).lower() if m else dev_id.lower()
-                spk_guid = guid_tail(getattr(spk, "id", "") or "")
-                candidates = sc.all_microphones(include_loopback=True)
-                loopbacks = [m for m in candidates if getattr(m, "isloopback", False)]
-                exact = [m for m in loopbacks if guid_tail(getattr(m, "id", "") or "") == spk_guid]
-                name_match = [m for m in loopbacks if spk.name.lower() in (m.name or "").lower()]
-                pick = (exact or name_match or loopbacks)
-                return pick[0] if pick else None
+                pick = loopback_for_speaker(getattr(spk, "id", "") or "", spk.name or "")
+                if pick is None:
+                    loopback_for_speaker.cache_clear()
+                return pick
             except Exception:
                 return None
 
         # --- Mic Capture (Threaded) ---
         mic_state = {"peak": 0.0}
-        
+        mic_rebind = threading.Event()  # default capture device changed or VU rebind requested
+        EDF_CAPTURE, EROLE_CONSOLE = 1, 0
+
+        def watch_default_mic():
+            """Registers for default-capture-device changes. Returns (enumerator, callback) or None."""
+            if COMObject is None:
+                return None
+            try:
+                class MicDeviceCallback(COMObject):
+                    _com_interfaces_ = [IMMNotificationClient]
+
+                    def OnDefaultDeviceChanged(self, flow, role, device_id):
+                        if flow == EDF_CAPTURE and role == EROLE_CONSOLE:
+                            mic_rebind.set()
+                        return 0
+
+                    def OnDeviceStateChanged(self, device_id, new_state): return 0
+                    def OnDeviceAdded(self, device_id): return 0
+                    def OnDeviceRemoved(self, device_id): return 0
+                    def OnPropertyValueChanged(self, device_id, key): return 0
+
+                cb = MicDeviceCallback()
+                enum = AudioUtilities.GetDeviceEnumerator()
+                enum.RegisterEndpointNotificationCallback(cb)
+                return enum, cb
+            except Exception:
+                return None
+
         def mic_thread_entry():
             if pythoncom:
                 try: pythoncom.CoInitializeEx(0)
                 except: pass
 
-            while not stop_ev.is_set():
-                if not audio_mode_ev.is_set():
-                    time.sleep(0.5)
-                    continue
-                try:
-                    # FIX: Use sc.default_microphone() to follow Windows Default
-                    mic = sc.default_microphone()
-                    
-                    if mic:
-                        print(f"[Mic Thread] Listening to: {mic.name}", flush=True)
-                        with mic.recorder(samplerate=48000, blocksize=1024) as rec:
-                             # FIX: Check rebind_ev here so the mic thread also restarts
-                             while audio_mode_ev.is_set() and not stop_ev.is_set() and not rebind_ev.is_set():
-                                 d = rec.record(numframes=1024)
-                                 # Calculate peak for the bar
-                                 p = float(np.max(np.abs(d)))
-                                 mic_state["peak"] = p
-                    else:
-                        time.sleep(1.0)
-                except Exception as e:
-                    print(f"[Mic Thread] Error: {e}", flush=True)
-                    time.sleep(1.0)
-                
-                # If we exited because of a rebind, wait a moment for things to settle
-                if rebind_ev.is_set():
-                    time.sleep(0.2)
-        
+            def idle(timeout):
+                # Sleep until stop, a default-mic change, or the timeout, whichever comes first
+                end = time.monotonic() + timeout
+                while not mic_rebind.is_set():
+                    left = end - time.monotonic()
+                    if left <= 0 or stop_ev.wait(min(left, 0.1)):
+                        break
+
+            # The recorder stays open until the default mic changes; no per-pass device query
+            watch = watch_default_mic()
+            try:
+                while not stop_ev.is_set():
+                    if not audio_mode_ev.is_set():
+                        stop_ev.wait(0.5)
+                        continue
+                    mic_rebind.clear()
+                    try:
+                        # FIX: Use sc.default_microphone() to follow Windows Default
+                        mic = sc.default_microphone()
+
+                        if mic:
+                            print(f"[Mic Thread] Listening to: {mic.name}", flush=True)
+                            scratch = None
+                            with mic.recorder(samplerate=48000, blocksize=1024) as rec:
+                                 while audio_mode_ev.is_set() and not stop_ev.is_set() and not mic_rebind.is_set():
+                                     d = rec.record(numframes=1024)
+                                     # Calculate peak for the bar (abs into a reused buffer)
+                                     if scratch is None or scratch.shape != d.shape or scratch.dtype != d.dtype:
+                                         scratch = np.empty_like(d)
+                                     np.abs(d, out=scratch)
+                                     mic_state["peak"] = float(scratch.max(initial=0.0))
+                        else:
+                            idle(1.0)
+                    except Exception as e:
+                        print(f"[Mic Thread] Error: {e}", flush=True)
+                        idle(1.0)
+            finally:
+                if watch is not None:
+                    try:
+                        watch[0].UnregisterEndpointNotificationCallback(watch[1])
+                    except Exception:
+                        pass
+
         mic_thr = threading.Thread(target=mic_thread_entry, daemon=True)
         mic_thr.start()
         # -----------------------------
 
+        # AGC/EMA state stays in Python floats (cheaper than NumPy scalars); Python floats don't
+        # promote the float32 band arrays they are applied to
         HIGH_TILT_DB_PER_OCT, alpha_up, alpha_dn = 3.0, 0.35, 0.15
         smooth = np.zeros(32, dtype=np.float32)
-        agc_level, noise_floor, zero_hold_until, last_send = 1e-4, 0.0, 0.0, 0.0
+        agc_level, noise_floor, zero_hold_until, last_send = 1e-4, 0.0, 0, 0
         agc_p90, agc_p10, frame_i = 1e-4, 0.0, 0
-        last_ch_send = 0.0
+        last_ch_send = 0
 
-        def process_block(x_multi, bin_idx, tilt_gain):
+        use_jit = _VU_JIT
+        if use_jit:
+            try:
+                # First call compiles the kernels (or loads them from numba's on-disk cache)
+                _vu_mono_peaks(np.zeros((2, 2), np.float32), np.zeros(2, np.float32), np.zeros(2, np.float32))
+                _vu_band_power(np.zeros(4, np.complex64), np.zeros(1, np.intp), np.ones(1, np.intp),
+                               np.ones(1, np.float32), np.zeros(1, np.float32))
+                _vu_smooth(np.zeros(1, np.float32), np.zeros(1, np.float32), 0.0, 1e-4, alpha_up, alpha_dn)
+            except Exception:
+                use_jit = False
+
+        def process_block(x_multi, band_starts, band_ends, tilt_gain):
             nonlocal smooth, agc_level, noise_floor, zero_hold_until, last_send, agc_p90, agc_p10, frame_i, last_ch_send
-            x_multi = np.nan_to_num(x_multi, nan=0.0, posinf=0.0, neginf=0.0)
-            
-            if x_multi.ndim == 2:
+            nonlocal mono_buf, peaks_buf
+            # One reduction spots NaN/inf; only then rewrite the block (in place)
+            if not np.isfinite(x_multi.sum()):
+                np.nan_to_num(x_multi, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+            now = time.monotonic_ns()
+            # The spectrum only feeds the VU bars; channel/audio modes just need the peaks
+            need_fft = enabled_ev.is_set()
+
+            ch_peaks = None
+            if x_multi.ndim == 2 and use_jit:
+                if mono_buf.shape[0] != x_multi.shape[0] or peaks_buf.shape[0] != x_multi.shape[1]:
+                    mono_buf = np.empty(x_multi.shape[0], dtype=np.float32)
+                    peaks_buf = np.empty(x_multi.shape[1], dtype=np.float32)
+                _vu_mono_peaks(x_multi, mono_buf, peaks_buf)
+                x, ch_peaks = mono_buf, peaks_buf
+            elif not need_fft:
+                x = None
+            elif x_multi.ndim == 2:
                 x = x_multi.mean(axis=1).astype(np.float32, copy=False)
             else:
                 x = x_multi.astype(np.float32, copy=False)
 
-            x = x - np.mean(x)
-            if window is not None and len(x) == len(window):
-                x = x * window
-
-            X = np.fft.rfft(x, n=blocksize)
-            mag = np.abs(X).astype(np.float32)
-
-            bands = np.zeros(32, dtype=np.float32)
-            for i, idx in enumerate(bin_idx):
-                bands[i] = float(np.sum(mag[idx])) * float(tilt_gain[i])
-
-            frame_i += 1
-            if frame_i % 6 == 0:
-                agc_p90 = float(np.percentile(bands, 90))
-                agc_p10 = float(np.percentile(bands, 10))
-
-            agc_level = 0.90 * agc_level + 0.10 * max(agc_p90, 1e-8)
-            noise_floor = 0.95 * noise_floor + 0.05 * max(agc_p10, 0.0)
-
-            now = time.time()
-            if agc_level < 5e-7:
-                zero_hold_until = now + 0.2
-
-            if enabled_ev.is_set() and now >= zero_hold_until:
-                b = np.maximum(bands - noise_floor, 0.0) / (agc_level + 1e-9)
-                b = np.log1p(6.0 * b) / np.log1p(6.0)
-
-                up = b > smooth
-                smooth[up] = smooth[up] * (1.0 - alpha_up) + b[up] * alpha_up
-                smooth[~up] = smooth[~up] * (1.0 - alpha_dn) + b[~up] * alpha_dn
-
-                if now - last_send >= frame_dt:
-                    levels = np.clip(np.rint(smooth * 8.0), 0, 8).astype(int).tolist()
-                    s = "".join(str(int(v)) for v in levels[:32])
-                    q_put_latest(out_q, ("V", s))
-                    last_send = now
-            elif enabled_ev.is_set() and now < zero_hold_until and now - last_send >= frame_dt:
-                 q_put_latest(out_q, ("V", "0"*32))
-                 last_send = now
-
-            if (channel_enabled_ev.is_set() or audio_mode_ev.is_set()) and now - last_ch_send >= 0.05: 
-                ch_peaks = np.max(np.abs(x_multi), axis=0)
+            if need_fft:
+                # The whole batch of hops goes through one FFT call; the DSP tail then runs per hop
+                for r in range(fft_in.shape[0]):
+                    xr = x[r * hop:(r + 1) * hop]
+                    n = min(len(xr), n_fft)
+                    row = fft_in[r]
+                    # Mean removal and the Hann window are written straight into the FFT input row
+                    np.subtract(xr[:n], np.mean(xr), out=row[:n])
+                    if n == len(window):
+                        np.multiply(row[:n], window, out=row[:n])
+                    if n < n_fft:
+                        row[n:] = 0.0
+
+                for X in run_rfft():
+                    if use_jit:
+                        _vu_band_power(X, band_starts, band_ends, tilt_gain, bands)
+                    else:
+                        # |X|^2 without a per-bin sqrt; only the 32 band sums get one
+                        np.multiply(X.real, X.real, out=power)
+                        np.multiply(X.imag, X.imag, out=power_im)
+                        np.add(power, power_im, out=power)
+
+                        np.cumsum(power, dtype=np.float64, out=power_csum[1:])
+                        np.take(power_csum, band_ends, out=band_hi)
+                        np.take(power_csum, band_starts, out=band_lo)
+                        np.subtract(band_hi, band_lo, out=band_hi)
+                        np.sqrt(band_hi, out=bands)
+                        np.multiply(bands, tilt_gain, out=bands)
+
+                    frame_i += 1
+                    if frame_i % 6 == 0:
+                        # Nearest-rank 10th/90th percentile of the 32 bands: one O(n) selection
+                        np.copyto(agc_sel, bands)
+                        agc_sel.partition((3, 28))
+                        agc_p10 = float(agc_sel[3])
+                        agc_p90 = float(agc_sel[28])
+
+                    agc_level = 0.90 * agc_level + 0.10 * max(agc_p90, 1e-8)
+                    noise_floor = 0.95 * noise_floor + 0.05 * max(agc_p10, 0.0)
+
+                    if agc_level < 5e-7:
+                        zero_hold_until = now + ZERO_HOLD_NS
+
+                    if now >= zero_hold_until:
+                        if use_jit:
+                            _vu_smooth(bands, smooth, noise_floor, agc_level, alpha_up, alpha_dn)
+                        else:
+                            b = b_buf
+                            np.subtract(bands, noise_floor, out=b)
+                            np.maximum(b, 0.0, out=b)
+                            np.divide(b, agc_level + 1e-9, out=b)
+                            np.multiply(b, 6.0, out=b)
+                            np.log1p(b, out=b)
+                            np.multiply(b, _INV_LOG7, out=b)
+
+                            # Per-band attack/release coefficient, then smooth += alpha * (b - smooth)
+                            np.greater(b, smooth, out=up_buf)
+                            alpha_buf.fill(alpha_dn)
+                            np.copyto(alpha_buf, alpha_up, where=up_buf)
+                            np.subtract(b, smooth, out=b)
+                            np.multiply(b, alpha_buf, out=b)
+                            np.add(smooth, b, out=smooth)
+
+                        if now - last_send >= FRAME_DT_NS:
+                            np.multiply(smooth, 8.0, out=lvl_buf)
+                            np.rint(lvl_buf, out=lvl_buf)
+                            np.clip(lvl_buf, 0, 8, out=lvl_buf)
+                            vu_slot.write_vu(lvl_buf)
+                            last_send = now
+                    elif now - last_send >= FRAME_DT_NS:
+                        vu_slot.write_vu(0)
+                        last_send = now
+
+            if (channel_enabled_ev.is_set() or audio_mode_ev.is_set()) and now - last_ch_send >= CH_DT_NS:
+                if ch_peaks is None:
+                    # max |v| per channel without materializing np.abs(x_multi)
+                    ch_peaks = np.maximum(x_multi.max(axis=0), -x_multi.min(axis=0))
                 num_ch = len(ch_peaks)
                 
                 if audio_mode_ev.is_set():
-                     l_val = ch_peaks[0] if num_ch >= 1 else 0.0
-                     r_val = ch_peaks[1] if num_ch >= 2 else l_val
-                     mic_val = mic_state["peak"] 
-
-                     l_int = int(min(1.0, l_val * 1) * 100)
-                     r_int = int(min(1.0, r_val * 1) * 100)
-                     
-                     # Boosted mic sensitivity for visibility
-                     m_int = int(min(1.0, mic_val * 1.5) * 100) 
-
-                     q_put_latest(out_q, ("CH", [l_int, r_int, m_int]))
+                     lrm = ch_scratch[:3]
+                     lrm[0] = ch_peaks[0] if num_ch >= 1 else 0.0
+                     lrm[1] = ch_peaks[1] if num_ch >= 2 else lrm[0]
+                     lrm[2] = mic_state["peak"]
+                     vu_slot.write_ch(ch_percent(lrm, ch_gain_audio))
 
                 elif channel_enabled_ev.is_set():
-                    out_levels = [0]*6
-                    if num_ch >= 1: out_levels[0] = ch_peaks[0]
-                    if num_ch >= 2: out_levels[1] = ch_peaks[1]
+                    ch_scratch.fill(0.0)
+                    if num_ch >= 1: ch_scratch[0] = ch_peaks[0]
+                    if num_ch >= 2: ch_scratch[1] = ch_peaks[1]
                     if num_ch >= 6:
-                        out_levels[2], out_levels[3], out_levels[4], out_levels[5] = ch_peaks[2], ch_peaks[4], ch_peaks[5], ch_peaks[3]
+                        ch_scratch[2:6] = ch_peaks[[2, 4, 5, 3]]
                     elif num_ch >= 4:
-                        out_levels[3], out_levels[4] = ch_peaks[2], ch_peaks[3]
-                    
-                    out_ints = [int(min(1.0, v * 1.5) * 100) for v in out_levels]
-                    q_put_latest(out_q, ("CH", out_ints))
+                        ch_scratch[3:5] = ch_peaks[2:4]
+
+                    vu_slot.write_ch(ch_percent(ch_scratch, 1.5))
                 
                 last_ch_send = now
 
 
         while not stop_ev.is_set():
             if not enabled_ev.is_set() and not channel_enabled_ev.is_set() and not audio_mode_ev.is_set():
-                time.sleep(0.2)
+                stop_ev.wait(0.2)
                 continue
 
             loopmic = pick_sc_loopback_once()
             if not loopmic:
-                time.sleep(0.5)
+                stop_ev.wait(0.5)
                 continue
 
             sr = 48000
@@ -979,9 +1562,15 @@ def _vu_worker(out_q, stop_ev, enabled_ev, channel_enabled_ev, audio_mode_ev, re
             try: ch_count = loopmic.channels
             except: ch_count = 2
 
-            bin_idx, centers = build_bins(sr)
+            band_starts, band_ends, centers = build_bins(sr)
             fref = 1000.0
-            tilt_gain = np.power(np.maximum(centers, 1.0) / fref, HIGH_TILT_DB_PER_OCT / 6.0).astype(np.float32)
+            tilt_gain = np.power(np.maximum(centers, 1.0) / fref, HIGH_TILT_DB_PER_OCT / 6.0)
+            # sqrt(width) keeps the band RMS on the scale of the old per-bin magnitude sum
+            tilt_gain = (tilt_gain * np.sqrt(band_ends - band_starts)).astype(np.float32)
+
+            batch = pick_batch(sr)
+            if fft_in.shape[0] != batch:
+                fft_in, run_rfft = make_rfft(n_fft, batch)
 
             # --- Main Loopback Recording Loop ---
             try:
@@ -991,20 +1580,30 @@ def _vu_worker(out_q, stop_ev, enabled_ev, channel_enabled_ev, audio_mode_ev, re
                             # This breaks the 'with' block, triggering a search for the speaker and mic again
                             print("[VU Worker] Rebind triggered: Refreshing devices...", flush=True)
                             # Wait briefly so the GUI has time to clear the flag or just clear it here
-                            time.sleep(0.5)
+                            stop_ev.wait(0.5)
                             rebind_ev.clear() 
+                            loopback_for_speaker.cache_clear()
+                            mic_rebind.set()
                             break
                             
                         if not enabled_ev.is_set() and not channel_enabled_ev.is_set() and not audio_mode_ev.is_set():
-                            time.sleep(0.1)
+                            stop_ev.wait(0.1)
                             continue
                             
-                        x = rec.record(numframes=hop)
-                        process_block(x, bin_idx, tilt_gain)
+                        x = rec.record(numframes=hop * batch)
+                        process_block(x, band_starts, band_ends, tilt_gain)
             except Exception:
-                time.sleep(0.2)
+                # Device may be gone; enumerate again on the next pick
+                loopback_for_speaker.cache_clear()
+                stop_ev.wait(0.2)
 
     finally:
+        vu_slot = None
+        try:
+            if vu_shm is not None:
+                vu_shm.close()
+        except Exception:
+            pass
         try:
             if pythoncom is not None:
                 pythoncom.CoUninitialize()
@@ -1012,6 +1611,32 @@ def _vu_worker(out_q, stop_ev, enabled_ev, channel_enabled_ev, audio_mode_ev, re
             pass
 
 
+# ---------------- Screen capture ----------------
+SCREEN_SAMPLES = 4  # samples averaged per output pixel along each axis
+
+def _grab_gray(sct, bbox, w: int, h: int):
+    """Captures bbox (None = whole desktop) as a w x h 'L' image.
+    The mss path samples the raw BGRA buffer directly; no full-size PIL image is built."""
+    if sct is not None:
+        try:
+            if bbox is None:
+                mon = sct.monitors[0]
+            else:
+                mon = {"left": bbox[0], "top": bbox[1], "width": bbox[2] - bbox[0], "height": bbox[3] - bbox[1]}
+            shot = sct.grab(mon)
+            bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+            ys = ((np.arange(h * SCREEN_SAMPLES) + 0.5) * (shot.height / (h * SCREEN_SAMPLES))).astype(np.intp)
+            xs = ((np.arange(w * SCREEN_SAMPLES) + 0.5) * (shot.width / (w * SCREEN_SAMPLES))).astype(np.intp)
+            px = bgra[ys[:, None], xs[None, :]].astype(np.float32)
+            lum = px[..., 2] * 0.299 + px[..., 1] * 0.587 + px[..., 0] * 0.114
+            small = lum.reshape(h, SCREEN_SAMPLES, w, SCREEN_SAMPLES).mean(axis=(1, 3))
+            return Image.fromarray(np.rint(small).astype(np.uint8))
+        except Exception:
+            pass
+    img = ImageGrab.grab(bbox=bbox) if bbox is not None else ImageGrab.grab()
+    return img.resize((w, h), Image.BILINEAR).convert("L")
+
+
 # ---------------- Backend ----------------
 KNOWN_GAME_EXES = {
     "robloxplayerbeta.exe","robloxstudio.exe","robloxstudiobeta.exe",
@@ -1040,6 +1665,7 @@ class Backend:
 
         self.lcd = LcdState()
         self.matrix = MatrixState()
+        self._tick_revs = None
 
         self.astro_api = "https://games.roblox.com/v1/games?universeIds=2176212732"
         self.core_api  = "https://games.roblox.com/v1/games?universeIds=6109192776"
@@ -1053,7 +1679,8 @@ class Backend:
         self._vol_out = self._mp.Queue(maxsize=32)
         self._vol_proc = None
 
-        self._vu_out = self._mp.Queue(maxsize=8)
+        self._vu_shm = shared_memory.SharedMemory(create=True, size=VU_SLOT_SIZE)
+        self._vu_slot = _VuSlot(self._vu_shm.buf)
         self._vu_enabled = self._mp.Event()
         self._vu_channel_enabled = self._mp.Event()
         self._vu_audio_mode_enabled = self._mp.Event() # New event
@@ -1100,7 +1727,8 @@ class Backend:
                 return
             self._vu_proc = self._mp.Process(
                 target=_vu_worker,
-                args=(self._vu_out, self._native_stop, self._vu_enabled, self._vu_channel_enabled, self._vu_audio_mode_enabled, self._vu_rebind),
+                args=(self._native_stop, self._vu_enabled, self._vu_channel_enabled, self._vu_audio_mode_enabled, self._vu_rebind,
+                      self._vu_shm.name),
                 daemon=True
             )
             self._vu_proc.start()
@@ -1115,57 +1743,58 @@ class Backend:
     def _native_consumer_loop(self):
         last_vu_send = 0.0
         VU_SEND_DT = 1.0 / 40.0  # 40 fps
+        VOL_DRAIN_MAX = 8  # queued volume updates skipped per tick at most
+        vu_seq = ch_seq = 0
 
-        while self.running and not self._native_stop.is_set():
-            try:
-                # Volume
+        try:
+            while self.running and not self._native_stop.is_set():
                 try:
-                    kind, pct, name = self._vol_out.get(timeout=0.01)
-                    if kind == "VOL" and self.VOLUME_ENABLED:
-                        self.send_to_device(f"VOL:{int(pct)}|{str(name)}")
-                except Exception:
-                    pass
-
-                # VU / Channel drain
-                latest_vu = None
-                latest_ch = None
-                
-                # Drain the queue to get latest values
-                while True:
+                    # Volume: only the newest level matters, so drain a bounded backlog and send that
                     try:
-                        data = self._vu_out.get_nowait()
-                        if data[0] == "V":
-                            latest_vu = data[1]
-                        elif data[0] == "CH":
-                            latest_ch = data[1]
+                        vol_msg = self._vol_out.get(timeout=0.01)
+                        for _ in range(VOL_DRAIN_MAX):
+                            try:
+                                vol_msg = self._vol_out.get_nowait()
+                            except Empty:
+                                break
+                        kind, pct, name = vol_msg
+                        if kind == "VOL" and self.VOLUME_ENABLED:
+                            self.send_to_device(f"VOL:{int(pct)}|{str(name)}")
                     except Exception:
-                        break
+                        pass
 
-                now = time.time()
+                    # Latest channel levels from the shared slot
+                    ch_seq, latest_ch = self._vu_slot.read_ch(ch_seq)
+
+                    now = time.time()
                 
-                # Send VU
-                if self.VU_ENABLED and latest_vu is not None and (now - last_vu_send) >= VU_SEND_DT:
-                    self.send_to_device("V:" + str(latest_vu))
-                    last_vu_send = now
+                    # Send VU (latest frame from the shared slot; a newer seq waits until it is sent)
+                    if self.VU_ENABLED and (now - last_vu_send) >= VU_SEND_DT:
+                        vu_seq, levels = self._vu_slot.read_vu(vu_seq)
+                        if levels is not None:
+                            self.send_vu(levels)
+                            last_vu_send = now
                 
-                # Send Channel Levels (Both Audio Mode and Channel Mode use this)
-                if (self.CHANNEL_ENABLED or self.AUDIO_MODE_ENABLED) and latest_ch is not None:
-                     # format: CH:50,75,100
-                     s_vals = ",".join(str(v) for v in latest_ch)
-                     self.send_to_device(f"CH:{s_vals}")
-
-                # auto-restart dead workers
-                with self._native_lock:
-                    if self.VOLUME_ENABLED and self._vol_proc is not None and (not self._vol_proc.is_alive()):
-                        _log("Volume process died; restarting.")
-                        self._start_volume_proc()
-                    if self._vu_proc is not None and (not self._vu_proc.is_alive()):
-                        _log("VU process died; restarting.")
-                        self._start_vu_proc()
-
-                time.sleep(0.001)
-            except BaseException:
-                report_exception("native_consumer")
+                    # Send Channel Levels (Both Audio Mode and Channel Mode use this)
+                    if (self.CHANNEL_ENABLED or self.AUDIO_MODE_ENABLED) and latest_ch is not None:
+                         self.send_ch(latest_ch)
+
+                    # auto-restart dead workers
+                    with self._native_lock:
+                        if self.VOLUME_ENABLED and self._vol_proc is not None and (not self._vol_proc.is_alive()):
+                            _log("Volume process died; restarting.")
+                            self._start_volume_proc()
+                        if self._vu_proc is not None and (not self._vu_proc.is_alive()):
+                            _log("VU process died; restarting.")
+                            self._start_vu_proc()
+
+                    time.sleep(0.001)
+                except BaseException:
+                    report_exception("native_consumer")
+        finally:
+            # On shutdown the last reader of the shared slot frees it (stop() may have timed out on us)
+            if not self.running:
+                self._release_vu_shm()
 
     def stop_native_workers(self):
         with self._native_lock:
@@ -1188,12 +1817,34 @@ class Backend:
             self._vol_proc = None
             self._vu_proc = None
 
+    def _release_vu_shm(self):
+        """Frees the VU shared memory once; only call when no thread is reading _vu_slot."""
+        with self._native_lock:
+            shm, self._vu_shm = self._vu_shm, None
+            self._vu_slot = None  # drops the numpy views, so close() has no exported buffers
+        if shm is None:
+            return
+        try:
+            shm.close()
+            shm.unlink()
+        except Exception:
+            pass
+
     def stop(self):
         self.running = False
         try:
             self.stop_native_workers()
         except Exception:
             pass
+        thr = self._native_consumer_thr
+        try:
+            if thr is not None:
+                thr.join(timeout=0.5)
+        except Exception:
+            pass
+        # A consumer still running frees the block itself on its way out
+        if thr is None or not thr.is_alive():
+            self._release_vu_shm()
         try:
             self.serial.send_line("GOODBYE")
             time.sleep(0.25)
@@ -1215,6 +1866,25 @@ class Backend:
             pass
         return ok
 
+    def send_vu(self, levels):
+        """VU fast path: levels is a uint8 array of 0..8, sent as ASCII digits without text parsing."""
+        ok = self.serial.send_raw(b"V:" + (levels + 48).tobytes() + b"\n", "V")
+        try:
+            self.matrix.apply_vu(levels)
+            self._emit("on_state")
+        except Exception:
+            pass
+        return ok
+
+    def send_ch(self, levels):
+        """CH fast path: levels is a sequence of plain ints 0..100 (e.g. read_ch's list), sent as CH:50,75,100."""
+        ok = self.serial.send_raw(b"CH:" + b",".join([_INT_STR[v] for v in levels]) + b"\n", "CH")
+        try:
+            self._emit("on_state")
+        except Exception:
+            pass
+        return ok
+
     def send_mode(self, mode_num: int):
         return self.send_to_device(f"MODE:{mode_num}")
 
@@ -1343,15 +2013,21 @@ class Backend:
     def loop_clock(self):
         try:
             last_mode_sent = None
+            # Only the seconds change on most ticks; the rest is re-formatted once a minute
+            last_min, head, tail = None, "", ""
             while self.running:
                 if self.mode == "CLOCK":
                     if last_mode_sent != "CLOCK":
                         self.send_mode(4)
                         last_mode_sent = "CLOCK"
-                    now = datetime.now()
-                    time_str = clean_string(now.strftime("%I:%M:%S %p"))
-                    date_str = clean_string(now.strftime("%m/%d/%Y"))
-                    self.send_to_device(f"CLOCK:{time_str}|{date_str}")
+                    now = time.localtime()
+                    minute = now[:5]
+                    if minute != last_min:
+                        last_min = minute
+                        head = "CLOCK:" + clean_string(time.strftime("%I:%M:", now))
+                        ampm = clean_string(time.strftime("%p", now))
+                        tail = (f" {ampm}" if ampm else "") + "|" + clean_string(time.strftime("%m/%d/%Y", now))
+                    self.send_to_device(f"{head}{now.tm_sec:02d}{tail}")
                     time.sleep(1.0)
                 else:
                     last_mode_sent = None
@@ -1399,8 +2075,7 @@ class Backend:
                     if not title or not artist or not playing:
                         msg = "No media|Player off"
                     else:
-                        def cln(s): return ''.join(c for c in unidecode(s) if 32 <= ord(c) <= 126).strip()
-                        msg = f"{cln(title)}|{cln(artist)}"
+                        msg = f"{clean_string(title)}|{clean_string(artist)}"
 
                     if msg != last_music_local and self.mode == "MUSIC":
                         self.send_to_device(f"MUSIC:{msg}")
@@ -1476,12 +2151,19 @@ class Backend:
         return False
 
     def loop_screen(self):
+        sct = None
         try:
             last_mode_sent = None
             FPS = 15.0
             frame_interval = 1.0 / FPS
             last = 0.0
 
+            if MSS_OK:
+                try:
+                    sct = mss.mss()
+                except Exception as e:
+                    _log(f"mss init failed, using ImageGrab: {e}")
+
             while self.running:
                 if self.mode != "SCREEN":
                     last_mode_sent = None
@@ -1507,49 +2189,48 @@ class Backend:
                     monitors = []
 
                 if not monitors:
-                    img_full = ImageGrab.grab().resize((32, 8), Image.BILINEAR)
-                    img_combined = img_full
+                    img_combined = _grab_gray(sct, None, 32, 8)
                 elif len(monitors) == 1:
                     m0 = monitors[0]
                     bbox0 = (m0.x, m0.y, m0.x + m0.width, m0.y + m0.height)
-                    img0 = ImageGrab.grab(bbox=bbox0).resize((32, 8), Image.BILINEAR)
-                    img_combined = img0
+                    img_combined = _grab_gray(sct, bbox0, 32, 8)
                 else:
                     m0, m1 = monitors[0], monitors[1]
                     bbox0 = (m0.x, m0.y, m0.x + m0.width, m0.y + m0.height)
                     bbox1 = (m1.x, m1.y, m1.x + m1.width, m1.y + m1.height)
-                    img0 = ImageGrab.grab(bbox=bbox0).resize((16, 8), Image.BILINEAR)
-                    img1 = ImageGrab.grab(bbox=bbox1).resize((16, 8), Image.BILINEAR)
-                    img_combined = Image.new("RGB", (32, 8))
+                    img0 = _grab_gray(sct, bbox0, 16, 8)
+                    img1 = _grab_gray(sct, bbox1, 16, 8)
+                    img_combined = Image.new("L", (32, 8))
                     img_combined.paste(img0, (0, 0))
                     img_combined.paste(img1, (16, 0))
 
-                gray = img_combined.convert("L")
-                bw = gray.point(lambda p: 255 if p > 128 else 0, mode="1")
-
-                rows32 = []
-                for y in range(8):
-                    row_val = 0
-                    for x in range(32):
-                        on = bw.getpixel((x, y)) != 0
-                        row_val = (row_val << 1) | (1 if on else 0)
-                    rows32.append(row_val)
-
-                payload = "".join(f"{row:08X}" for row in rows32)
+                # Threshold and pack MSB-first: each 32-px row becomes 4 bytes, i.e. 8 hex digits
+                bits = np.asarray(img_combined.convert("L"), dtype=np.uint8) > 128
+                payload = np.packbits(bits, axis=1).tobytes().hex().upper()
                 self.send_to_device("FB:" + payload)
 
         except BaseException:
             report_exception("loop_screen")
+        finally:
+            try:
+                if sct is not None:
+                    sct.close()
+            except Exception:
+                pass
 
-    def loop_lcd_tick(self):
+    def lcd_tick_once(self):
+        """One LCD animation / matrix decay step; driven every 50 ms by a GUI-thread QTimer."""
         try:
-            while self.running:
-                self.lcd.tick()
-                self.matrix.tick_decay(enabled=self.VU_ENABLED)
+            if not self.running:
+                return
+            self.lcd.tick()
+            self.matrix.tick_decay(enabled=self.VU_ENABLED)
+            revs = (self.lcd.rev, self.matrix.rev)
+            if revs != self._tick_revs:
+                self._tick_revs = revs
                 self._emit("on_state")
-                time.sleep(0.05)
-        except BaseException:
-            report_exception("loop_lcd_tick")
+        except Exception:
+            report_exception("lcd_tick_once")
 
 
 # ---------------- GUI (PySide6) ----------------
@@ -1557,6 +2238,24 @@ from PySide6 import QtCore, QtGui, QtWidgets  # noqa: E402
 
 AUDIOWIDE_FAMILY = None
 
+
+class _UiNotifier(QtCore.QObject):
+    """Wakes the GUI thread from worker threads; repeats collapse into one queued call until it runs."""
+    changed = QtCore.Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queued = False
+
+    def notify(self):
+        if not self._queued:
+            self._queued = True
+            self.changed.emit()
+
+    def take(self):
+        self._queued = False
+
+
 def _load_font_if_exists(ttf_path: str):
     global AUDIOWIDE_FAMILY
     if ttf_path and os.path.exists(ttf_path):
@@ -1571,10 +2270,106 @@ def _load_font_if_exists(ttf_path: str):
             pass
 
 
+_BRAND_FONTS = {}
+
+def _brand_font(px: int, fallback: QtGui.QFont) -> QtGui.QFont:
+    """Audiowide at px pixels (fallback's family if it didn't load); built once per size, after font loading."""
+    f = _BRAND_FONTS.get(px)
+    if f is None:
+        f = QtGui.QFont(AUDIOWIDE_FAMILY or "Audiowide")
+        if f.family() != "Audiowide":
+            f = QtGui.QFont(fallback)
+        f.setPixelSize(px)
+        _BRAND_FONTS[px] = f
+    return f
+
+
+_ASSET_CACHE = {}
+
+def _asset(assets_dir: str, name: str, kind=QtGui.QPixmap):
+    """Loads an image asset once per (kind, path); a missing file yields a null pixmap/icon."""
+    path = os.path.join(assets_dir, name)
+    obj = _ASSET_CACHE.get((kind, path))
+    if obj is None:
+        obj = kind(path) if os.path.exists(path) else kind()
+        _ASSET_CACHE[(kind, path)] = obj
+    return obj
+
+
+# One application-wide stylesheet, matched by objectName; set once in main(). Rules under a
+# container that recolour its children are listed after the container's blanket rule so they win.
+APP_QSS = """
+    QFrame#card {
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:1,
+            stop:0 rgba(18,22,32,245),
+            stop:1 rgba(8,10,14,245)
+        );
+        border-radius: 22px;
+    }
+
+    #titleBar, #titleBar QWidget { background: rgba(0,0,0,0.0); }
+    #titleBar #titleText { color: white; }
+    #titleBar QToolButton {
+        color: white;
+        background: transparent;
+        border: none;
+        padding: 2px 10px;
+        font-size: 16px;
+    }
+    #titleBar QToolButton:hover { background: rgba(255,255,255,0.08); border-radius: 6px; }
+
+    #leftMenu, #leftMenu QWidget { background: rgba(0,0,0,0); }
+    #leftMenu #brand { color: white; }
+    #leftMenu #brandSub { color: rgba(255,255,255,0.85); font-size: 18px; }
+    #leftMenu #menuSep { background: rgba(255,255,255,0.18); }
+    #leftMenu QPushButton#menuButton {
+        color: white;
+        text-align: left;
+        padding-left: 18px;
+        font-size: 16px;
+        border: none;
+        background: transparent;
+        border-left: 0px solid #1f8fe5;
+    }
+    #leftMenu QPushButton#menuButton[indicator="true"] { border-left: 6px solid #1f8fe5; }
+    #leftMenu QPushButton#menuButton:hover { background: rgba(255,255,255,0.05); }
+
+    #previewDivider { background: rgba(255,255,255,0.75); }
+
+    QPlainTextEdit#logView {
+        background: rgba(0,0,0,0.65);
+        border: none;
+        color: #1f8fe5;
+        font-family: Consolas;
+        font-size: 13px;
+        padding: 10px;
+    }
+
+    QLineEdit#serialInput {
+        background: rgba(255,255,255,0.12);
+        border: none;
+        border-radius: 10px;
+        padding: 12px 14px;
+        color: white;
+        font-size: 14px;
+    }
+
+    QToolButton#sendBtn {
+        background: rgba(255,255,255,0.12);
+        border: none;
+        border-radius: 10px;
+        color: white;
+        font-size: 20px;
+    }
+    QToolButton#sendBtn:hover { background: rgba(255,255,255,0.18); }
+"""
+
+
 class TitleBar(QtWidgets.QWidget):
     def __init__(self, parent):
         super().__init__(parent)
-        self.setFixedHeight(S(42))
+        self.setObjectName("titleBar")
+        self.setFixedHeight(TITLE_H)
         self.setAttribute(QtCore.Qt.WA_StyledBackground, True)
         self._drag_pos = None
         self.root = parent
@@ -1584,12 +2379,8 @@ class TitleBar(QtWidgets.QWidget):
         h.setSpacing(10)
 
         self.title = QtWidgets.QLabel("VORTEX")
-        f = QtGui.QFont(AUDIOWIDE_FAMILY or "Audiowide")
-        if f.family() != "Audiowide":
-            f = self.title.font()
-        f.setPixelSize(S(18))
-        self.title.setFont(f)
-        self.title.setStyleSheet("color: white;")
+        self.title.setFont(_brand_font(TITLE_FONT_PX, self.title.font()))
+        self.title.setObjectName("titleText")
 
         h.addWidget(self.title)
         h.addStretch(1)
@@ -1603,16 +2394,6 @@ class TitleBar(QtWidgets.QWidget):
 
         for b in (self.btn_tray, self.btn_min, self.btn_close):
             b.setCursor(QtCore.Qt.PointingHandCursor)
-            b.setStyleSheet("""
-                QToolButton {
-                    color: white;
-                    background: transparent;
-                    border: none;
-                    padding: 2px 10px;
-                    font-size: 16px;
-                }
-                QToolButton:hover { background: rgba(255,255,255,0.08); border-radius: 6px; }
-            """)
 
         self.btn_tray.clicked.connect(self.root.hide_to_tray)
         self.btn_min.clicked.connect(self.root.showMinimized)
@@ -1622,8 +2403,6 @@ class TitleBar(QtWidgets.QWidget):
         h.addWidget(self.btn_min)
         h.addWidget(self.btn_close)
 
-        self.setStyleSheet("QWidget { background: rgba(0,0,0,0.0); }")
-
     def mousePressEvent(self, e):
         if e.button() == QtCore.Qt.LeftButton:
             self._drag_pos = e.globalPosition().toPoint() - self.root.frameGeometry().topLeft()
@@ -1641,34 +2420,28 @@ class TitleBar(QtWidgets.QWidget):
 class MenuButton(QtWidgets.QPushButton):
     def __init__(self, text: str, active_indicator: bool):
         super().__init__(text)
+        self.setObjectName("menuButton")
         self.active_indicator = active_indicator
         self.active = False
         self.setCursor(QtCore.Qt.PointingHandCursor)
-        self.setFixedHeight(S(46))
+        self.setFixedHeight(MENU_BTN_H)
         self.setCheckable(False)
         self.setFocusPolicy(QtCore.Qt.NoFocus)
         self._apply()
 
     def set_active(self, on: bool):
-        self.active = bool(on)
+        on = bool(on)
+        if on == self.active:
+            return
+        self.active = on
         self._apply()
 
     def _apply(self):
-        left_bar = "6px" if (self.active and self.active_indicator) else "0px"
-        self.setStyleSheet(f"""
-            QPushButton {{
-                color: white;
-                text-align: left;
-                padding-left: 18px;
-                font-size: 16px;
-                border: none;
-                background: transparent;
-                border-left: {left_bar} solid #1f8fe5;
-            }}
-            QPushButton:hover {{
-                background: rgba(255,255,255,0.05);
-            }}
-        """)
+        # The left bar comes from APP_QSS's [indicator="true"] rule; re-polish to re-match it
+        self.setProperty("indicator", self.active and self.active_indicator)
+        st = self.style()
+        st.unpolish(self)
+        st.polish(self)
 
 
 class LeftMenu(QtWidgets.QWidget):
@@ -1676,7 +2449,8 @@ class LeftMenu(QtWidgets.QWidget):
         super().__init__()
         self.root = root
         self.assets_dir = assets_dir
-        self.setFixedWidth(S(270))
+        self.setObjectName("leftMenu")
+        self.setFixedWidth(MENU_W)
         self.setAttribute(QtCore.Qt.WA_StyledBackground, True)
 
         v = QtWidgets.QVBoxLayout(self)
@@ -1690,24 +2464,16 @@ class LeftMenu(QtWidgets.QWidget):
         self.logo.setFixedSize(54, 54)
         self.logo.setScaledContents(True)
 
-        logo_path = os.path.join(self.assets_dir, "vortexlogo.png")
-        if os.path.exists(logo_path):
-            self.logo.setPixmap(QtGui.QPixmap(logo_path))
-        else:
-            self.logo.setPixmap(QtGui.QPixmap())
+        self.logo.setPixmap(_asset(self.assets_dir, "vortexlogo.png"))
 
         brand_col = QtWidgets.QVBoxLayout()
         brand_col.setSpacing(2)
         self.brand = QtWidgets.QLabel("VORTEX")
         self.sub = QtWidgets.QLabel("Desk Peripherals")
-        self.brand.setStyleSheet("color: white;")
-        self.sub.setStyleSheet("color: rgba(255,255,255,0.85); font-size: 18px;")
+        self.brand.setObjectName("brand")
+        self.sub.setObjectName("brandSub")
 
-        f = QtGui.QFont(AUDIOWIDE_FAMILY or "Audiowide")
-        if f.family() != "Audiowide":
-            f = self.brand.font()
-        f.setPixelSize(S(30))
-        self.brand.setFont(f)
+        self.brand.setFont(_brand_font(BRAND_FONT_PX, self.brand.font()))
 
         brand_col.addWidget(self.brand)
         brand_col.addWidget(self.sub)
@@ -1722,7 +2488,7 @@ class LeftMenu(QtWidgets.QWidget):
         def sep():
             line = QtWidgets.QFrame()
             line.setFixedHeight(1)
-            line.setStyleSheet("background: rgba(255,255,255,0.18);")
+            line.setObjectName("menuSep")
             return line
 
         self.btn_auto  = MenuButton("Auto Mode", True)
@@ -1763,8 +2529,6 @@ class LeftMenu(QtWidgets.QWidget):
         v.addStretch(1)
         v.addWidget(self.btn_quit)
 
-        self.setStyleSheet("QWidget { background: rgba(0,0,0,0); }")
-
     def set_active_mode(self, mode_name: str, vu_on: bool, ch_on: bool, logo_on: bool, audio_on: bool, auto_on: bool):
         self.btn_auto.set_active(auto_on)
         self.btn_visit.set_active(mode_name == "VISIT")
@@ -1779,91 +2543,172 @@ class LeftMenu(QtWidgets.QWidget):
         self.btn_logo.set_active(logo_on)
 
 
+def _lcd_expand_dots(cols, dots, on, off):
+    """Writes on/off for every dot of the (2, 10, 16, 6) cell grid from (2, 16, 5) glyph columns."""
+    for row in range(2):
+        for gy in range(10):
+            for col in range(16):
+                for gx in range(6):
+                    if gy < 8 and gx < 5 and (cols[row, col, gx] >> gy) & 1:
+                        dots[row, gy, col, gx] = on
+                    else:
+                        dots[row, gy, col, gx] = off
+
+_LCD_JIT = False
+if NUMBA_OK:
+    _jitted = _jit(_lcd_expand_dots)
+    if _jitted is not None:
+        _lcd_expand_dots, _LCD_JIT = _jitted, True
+    del _jitted
+
+
 class LcdWidget(QtWidgets.QWidget):
+    BEZEL = QtGui.QColor(0, 0, 0)
+    LCD_ON = QtGui.QColor(220, 245, 255)
+    LCD_OFF = QtGui.QColor(49, 132, 234)  # also the glass behind the dots
+    _ON_RGB, _OFF_RGB = LCD_ON.rgb(), LCD_OFF.rgb()
+
     def __init__(self, backend: Backend):
         super().__init__()
         self.backend = backend
-        self.setFixedSize(S(450), S(129))
-
-    def paintEvent(self, e):
-        p = QtGui.QPainter(self)
-        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
-
-        outer = QtCore.QRectF(0.5, 0.5, self.width()-1, self.height()-1)
-        p.setPen(QtCore.Qt.NoPen)
-        p.setBrush(QtGui.QColor(0, 0, 0))
-        p.drawRoundedRect(outer, 18, 18)
+        self.setFixedSize(LCD_W, LCD_H)
+        # One pixel per LCD dot on a 6x10 cell pitch (1-dot column gap, 2-dot row gap between glyphs);
+        # the QImage wraps the numpy buffer, so the dots are written with array ops and blitted once
+        self._cols = np.zeros((2, 16, 5), dtype=np.uint8)
+        self._dots = np.zeros((2, 10, 16, 6), dtype=np.uint32)
+        self._img = QtGui.QImage(self._dots.data, 16*6, 2*10, 16*6*4, QtGui.QImage.Format_RGB32)
+
+        self._use_jit = _LCD_JIT
+        if self._use_jit:
+            try:
+                _lcd_expand_dots(self._cols, self._dots, 0, 0)  # compile (or load from cache) up front
+            except Exception:
+                self._use_jit = False
 
+        # Fixed size, so the bezel and dot-grid geometry is computed once
+        self._outer = QtCore.QRectF(0.5, 0.5, self.width()-1, self.height()-1)
         border = 10
-        inner = outer.adjusted(border, border, -border, -border)
-        p.setBrush(QtGui.QColor(49, 132, 234))
-        p.drawRoundedRect(inner, 14, 14)
-
-        px = 4
-        char_gap = 0 * px
-        gap_col = 1 * px
-        gap_row = 2 * px
-
-        total_w = 16*(5*px) + 15*(char_gap + gap_col)
-        total_h = 2*(8*px) + 1*(gap_row)
-
-        x0 = int(inner.left()) + int((inner.width() - total_w) * 0.5)
-        y0 = int(inner.top())  + int((inner.height() - total_h) * 0.5)
-
-        on = QtGui.QColor(220, 245, 255)
-        off = QtGui.QColor(49, 132, 234)
-
-        for row in range(2):
-            for col in range(16):
-                ch = self.backend.lcd.ddram[row][col]
-                if 0 <= ch <= 7:
-                    cols = _cgram_to_cols(self.backend.lcd.cgram.get(ch, [0]*8))
-                else:
-                    cols = _glyph_cols_for_ascii(ch)
+        self._inner = self._outer.adjusted(border, border, -border, -border)
+        self._px = px = 4
+        self._dots_w, self._dots_h = 16*6 - 1, 2*10 - 2
+        total_w, total_h = self._dots_w * px, self._dots_h * px
+        x0 = int(self._inner.left()) + int((self._inner.width() - total_w) * 0.5)
+        y0 = int(self._inner.top())  + int((self._inner.height() - total_h) * 0.5)
+        self._dots_rect = QtCore.QRect(x0, y0, total_w, total_h)
+
+        # What the last refresh() saw, to repaint only the cells that changed since
+        self._shown_codes = None
+        self._shown_cgram = None
+
+    def _cell_rect(self, row: int, col: int):
+        px = self._px
+        return QtCore.QRect(self._dots_rect.x() + col*6*px, self._dots_rect.y() + row*10*px, 5*px, 8*px)
+
+    def refresh(self):
+        """Schedules a repaint of just the character cells whose code or glyph changed."""
+        lcd = self.backend.lcd
+        codes = lcd.ddram.copy()
+        cgram = lcd.cgram.tobytes()
+        if self._shown_codes is None:
+            self.update()
+        else:
+            changed = codes != self._shown_codes
+            if cgram != self._shown_cgram:
+                changed |= codes <= 7
+            for row, col in zip(*np.nonzero(changed)):
+                self.update(self._cell_rect(int(row), int(col)))
+        self._shown_codes, self._shown_cgram = codes, cgram
+
+    _DOT_SHIFTS = np.arange(8, dtype=np.uint8)[None, :, None, None]  # gy -> bit gy of a glyph column
+
+    def _render_dots(self, on: int, off: int):
+        lcd = self.backend.lcd
+        cols = self._cols
+        codes = lcd.ddram.copy()  # one consistent snapshot
+        np.take(_GLYPH_COLS_LUT, codes, axis=0, out=cols)
+        custom = codes <= 7
+        if custom.any():
+            cols[custom] = _cgram_to_cols(lcd.cgram.tobytes())[codes[custom]]
+        if self._use_jit:
+            _lcd_expand_dots(cols, self._dots, on, off)
+            return
+        # (row, gy, col, gx) bits into the top-left 8x5 of each cell; the gaps stay off
+        bits = (cols[:, None, :, :] >> self._DOT_SHIFTS) & 1
+        self._dots.fill(off)
+        np.copyto(self._dots[:, :8, :, :5], on, where=bits.astype(bool))
 
-                base_x = x0 + col * (5*px + char_gap + gap_col)
-                base_y = y0 + row * (8*px + gap_row)
+    def paintEvent(self, e):
+        p = QtGui.QPainter(self)
 
-                for gx in range(5):
-                    col_bits = cols[gx] if gx < len(cols) else 0
-                    for gy in range(8):
-                        bit = (col_bits >> gy) & 1
-                        p.fillRect(QtCore.QRectF(base_x + gx*px, base_y + gy*px, px, px), on if bit else off)
+        # Cell-only updates (see refresh) lie inside the dot grid and skip the bezel
+        if not self._dots_rect.contains(e.rect()):
+            p.setRenderHint(QtGui.QPainter.Antialiasing, True)
+            p.setPen(QtCore.Qt.NoPen)
+            p.setBrush(self.BEZEL)
+            p.drawRoundedRect(self._outer, 18, 18)
+            p.setBrush(self.LCD_OFF)
+            p.drawRoundedRect(self._inner, 14, 14)
+            # Only the rounded bezel needs AA; the integer-scaled dot blit stays sharp without it
+            p.setRenderHint(QtGui.QPainter.Antialiasing, False)
+
+        self._render_dots(self._ON_RGB, self._OFF_RGB)
+        p.drawImage(QtCore.QRectF(self._dots_rect), self._img, QtCore.QRectF(0, 0, self._dots_w, self._dots_h))
         p.end()
 
 
 class MatrixWidget(QtWidgets.QWidget):
+    MAT_ON = QtGui.QColor(255, 60, 60)
+    MAT_OFF = QtGui.QColor(102, 102, 102, 180)
+
     def __init__(self, backend: Backend):
         super().__init__()
         self.backend = backend
-        self.setFixedSize(S(440), S(132))
-
-    def paintEvent(self, e):
-        p = QtGui.QPainter(self)
-        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
-
-        p.fillRect(self.rect(), QtGui.QColor(0,0,0,0))
-
-        led_on = QtGui.QColor(255, 60, 60)
-        led_off = QtGui.QColor(102, 102, 102, 180)
+        self.setFixedSize(MAT_W, MAT_H)
 
         pad = 10
         cols, rows = 32, 8
-        area_w = self.width() - pad*2
-        area_h = self.height() - pad*2
-
-        step_x = area_w / cols
-        step_y = area_h / rows
+        step_x = (self.width() - pad*2) / cols
+        step_y = (self.height() - pad*2) / rows
         r = min(step_x, step_y) * 0.48
 
-        for y in range(rows):
-            for x in range(cols):
-                cx = pad + (x + 0.5) * step_x
-                cy = pad + (y + 0.5) * step_y
-                onpx = bool(self.backend.matrix.pixels[y][x])
-                p.setBrush(led_on if onpx else led_off)
-                p.setPen(QtCore.Qt.NoPen)
-                p.drawEllipse(QtCore.QPointF(cx, cy), r, r)
+        # The widget size is fixed, so the LEDs are rendered once as sprites and only blitted per paint;
+        # they are rebuilt at paint time if the device pixel ratio changes (e.g. moved to another screen)
+        d = int(np.ceil(2*r)) + 2
+        self._led_d, self._led_r = d, r
+        self._sprite_dpr = None
+        self._led_on = self._led_off = None
+        self._led_pos = [[QtCore.QPointF(pad + (x + 0.5) * step_x - d/2, pad + (y + 0.5) * step_y - d/2)
+                          for x in range(cols)] for y in range(rows)]
+
+    def _build_sprites(self, dpr: float):
+        self._led_on = self._led_sprite(self._led_d, self._led_r, self.MAT_ON, dpr)
+        self._led_off = self._led_sprite(self._led_d, self._led_r, self.MAT_OFF, dpr)
+        self._sprite_dpr = dpr
+
+    @staticmethod
+    def _led_sprite(d: int, r: float, color, dpr: float = 1.0):
+        # Backed at device resolution so the dots stay sharp on HiDPI; drawn in logical coordinates
+        pm = QtGui.QPixmap(int(np.ceil(d * dpr)), int(np.ceil(d * dpr)))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(QtCore.Qt.transparent)
+        p = QtGui.QPainter(pm)
+        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        p.setPen(QtCore.Qt.NoPen)
+        p.setBrush(color)
+        p.drawEllipse(QtCore.QPointF(d/2, d/2), r, r)
+        p.end()
+        return pm
+
+    def paintEvent(self, e):
+        # Not WA_OpaquePaintEvent: the card gradient must show between the (translucent) LEDs
+        dpr = self.devicePixelRatioF()
+        if dpr != self._sprite_dpr:
+            self._build_sprites(dpr)
+        p = QtGui.QPainter(self)
+        led_on, led_off = self._led_on, self._led_off
+        for pos_row, px_row in zip(self._led_pos, self.backend.matrix.pixels.tolist()):
+            for pos, onpx in zip(pos_row, px_row):
+                p.drawPixmap(pos, led_on if onpx else led_off)
         p.end()
 
 
@@ -1871,22 +2716,18 @@ class LogView(QtWidgets.QPlainTextEdit):
     def __init__(self):
         super().__init__()
         self.setReadOnly(True)
-        self.setStyleSheet("""
-            QPlainTextEdit {
-                background: rgba(0,0,0,0.65);
-                border: none;
-                color: #1f8fe5;
-                font-family: Consolas;
-                font-size: 13px;
-                padding: 10px;
-            }
-        """)
+        self.setObjectName("logView")
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
+        self.setMaximumBlockCount(LOG_VIEW_MAX_LINES)  # oldest lines drop off instead of growing forever
+        self.setCenterOnScroll(False)
 
-    def append_line(self, line: str):
-        self.appendPlainText(line)
+    def append_lines(self, lines):
+        """Appends a batch of lines with a single layout pass; follows the tail unless scrolled up."""
         sb = self.verticalScrollBar()
-        sb.setValue(sb.maximum())
+        at_bottom = sb.value() >= sb.maximum() - 4
+        self.appendPlainText("\n".join(lines))
+        if at_bottom:
+            sb.setValue(sb.maximum())
 
 
 class MainWindow(QtWidgets.QWidget):
@@ -1910,7 +2751,7 @@ class MainWindow(QtWidgets.QWidget):
         self.setWindowTitle("Vortex Desk Peripherals")
         self.setWindowFlag(QtCore.Qt.FramelessWindowHint, True)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
-        self.resize(S(1280), S(720))
+        self.resize(WINDOW_W, WINDOW_H)
 
         # ---- Fonts FIRST ----
         _load_font_if_exists(os.path.join(self.assets_dir, "Font", "Audiowide-Regular.ttf"))
@@ -1921,15 +2762,6 @@ class MainWindow(QtWidgets.QWidget):
 
         self.card = QtWidgets.QFrame(self)
         self.card.setObjectName("card")
-        self.card.setStyleSheet("""
-            QFrame#card {
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:1,
-                    stop:0 rgba(18,22,32,245),
-                    stop:1 rgba(8,10,14,245)
-                );
-                border-radius: 22px;
-            }
-        """)
 
         root = QtWidgets.QVBoxLayout(self)
         root.setContentsMargins(10, 10, 10, 10)
@@ -1963,7 +2795,7 @@ class MainWindow(QtWidgets.QWidget):
 
         div = QtWidgets.QFrame()
         div.setFixedWidth(2)
-        div.setStyleSheet("background: rgba(255,255,255,0.75);")
+        div.setObjectName("previewDivider")
         top_row.addWidget(div)
 
         self.matrix_widget = MatrixWidget(self.backend)
@@ -1979,32 +2811,14 @@ class MainWindow(QtWidgets.QWidget):
 
         self.serial_input = QtWidgets.QLineEdit()
         self.serial_input.setPlaceholderText("Type here to send Serial Command")
-        self.serial_input.setStyleSheet("""
-            QLineEdit {
-                background: rgba(255,255,255,0.12);
-                border: none;
-                border-radius: 10px;
-                padding: 12px 14px;
-                color: white;
-                font-size: 14px;
-            }
-        """)
+        self.serial_input.setObjectName("serialInput")
         bottom.addWidget(self.serial_input, 1)
 
         self.btn_send = QtWidgets.QToolButton()
         self.btn_send.setText("➜")
         self.btn_send.setCursor(QtCore.Qt.PointingHandCursor)
-        self.btn_send.setFixedSize(S(46), S(46))
-        self.btn_send.setStyleSheet("""
-            QToolButton {
-                background: rgba(255,255,255,0.12);
-                border: none;
-                border-radius: 10px;
-                color: white;
-                font-size: 20px;
-            }
-            QToolButton:hover { background: rgba(255,255,255,0.18); }
-        """)
+        self.btn_send.setFixedSize(SEND_BTN, SEND_BTN)
+        self.btn_send.setObjectName("sendBtn")
         bottom.addWidget(self.btn_send)
 
         self.left.btn_auto.clicked.connect(self._on_auto_clicked)
@@ -2030,11 +2844,19 @@ class MainWindow(QtWidgets.QWidget):
 
         self.backend.on("on_state", self._refresh_previews)
 
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self._ui_tick)
-        self.timer.start(50)
+        # Widgets repaint only when the backend state revision moved
+        self._last_lcd_rev = -1
+        self._last_mat_rev = -1
+        self._last_indicator = None
+
+        # Backend state changes and new log lines push a (coalesced) UI refresh instead of polling
+        self._notifier = _UiNotifier(self)
+        self._notifier.changed.connect(self._ui_tick, QtCore.Qt.QueuedConnection)
+        self.backend.on("on_state", self._notifier.notify)
+        _LOG_LISTENERS.append(self._notifier.notify)
 
         self._refresh_left_indicator()
+        self._notifier.notify()  # pick up lines logged before the window existed
 
     # -------- TRAY (FIX: Qt-native tray, always present if Windows tray exists) --------
     def _build_qt_tray(self):
@@ -2044,10 +2866,9 @@ class MainWindow(QtWidgets.QWidget):
                 self.qtray = None
                 return
 
-            icon_path = os.path.join(self.assets_dir, "Icon.ico")
-            icon = QtGui.QIcon(icon_path) if os.path.exists(icon_path) else self.style().standardIcon(
-                QtWidgets.QStyle.SP_ComputerIcon
-            )
+            icon = _asset(self.assets_dir, "Icon.ico", QtGui.QIcon)
+            if icon.isNull():
+                icon = self.style().standardIcon(QtWidgets.QStyle.SP_ComputerIcon)
 
             self.qtray = QtWidgets.QSystemTrayIcon(icon, self)
             self.qtray.setToolTip("Vortex Desk Peripherals")
@@ -2110,22 +2931,28 @@ class MainWindow(QtWidgets.QWidget):
         self.serial_input.clear()
 
     def _ui_tick(self):
-        try:
-            while True:
-                line = _LOG_QUEUE.get_nowait()
-                self.log.append_line(line)
-        except Empty:
-            pass
+        self._notifier.take()
+        lines = []
+        while _LOG_QUEUE:
+            lines.append(_LOG_QUEUE.popleft())
+        if lines:
+            self.log.append_lines(lines)
 
         self._refresh_left_indicator()
-        self.lcd_widget.update()
-        self.matrix_widget.update()
+        lcd_rev = self.backend.lcd.rev
+        if lcd_rev != self._last_lcd_rev:
+            self._last_lcd_rev = lcd_rev
+            self.lcd_widget.refresh()
+        mat_rev = self.backend.matrix.rev
+        if mat_rev != self._last_mat_rev:
+            self._last_mat_rev = mat_rev
+            self.matrix_widget.update()
 
     def _refresh_previews(self):
         pass
 
     def _refresh_left_indicator(self):
-        self.left.set_active_mode(
+        state = (
             self.backend.mode, 
             self.backend.VU_ENABLED, 
             self.backend.CHANNEL_ENABLED, 
@@ -2133,6 +2960,10 @@ class MainWindow(QtWidgets.QWidget):
             self.backend.AUDIO_MODE_ENABLED,
             self.backend.AUTO_ENABLED
         )
+        if state == self._last_indicator:
+            return
+        self._last_indicator = state
+        self.left.set_active_mode(*state)
 
     # FIX: do not hide if tray failed to initialize
     def hide_to_tray(self):
@@ -2186,13 +3017,17 @@ def main():
         threading.Thread(target=runner(backend, backend.loop_system), daemon=True),
         threading.Thread(target=runner(backend, backend.loop_auto), daemon=True),
         threading.Thread(target=runner(backend, backend.loop_screen), daemon=True),
-        threading.Thread(target=runner(backend, backend.loop_lcd_tick), daemon=True),
     ]
     for t in threads:
         t.start()
 
     app = QtWidgets.QApplication(sys.argv)
 
+    # The LCD/matrix tick is pure in-memory work, so it runs on the event loop instead of its own thread
+    lcd_timer = QtCore.QTimer()
+    lcd_timer.timeout.connect(backend.lcd_tick_once)
+    lcd_timer.start(50)
+
     # FIX: tray apps should not quit when main window is closed/hidden
     app.setQuitOnLastWindowClosed(False)
 
@@ -2200,6 +3035,7 @@ def main():
     if base_font.family() == "Noto Sans":
         base_font.setPointSize(10)
         app.setFont(base_font)
+    app.setStyleSheet(APP_QSS)
 
     w = MainWindow(backend)
     w.show()